@@ -1,32 +1,67 @@
 """Main data analyzer for flat files."""
 
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.json
+import pyarrow.parquet as pq
 
-from .field_detector import FieldTypeDetector, get_sample_values
-from .models import AnalysisResult, FieldAnalysis, FieldType
+try:
+    # orjson serializes/parses several times faster than stdlib json;
+    # optional dependency (the 'fast' extra)
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from .field_detector import FieldTypeDetector, get_sample_values, is_string_like
+from .models import AnalysisResult, FieldAnalysis, FieldStats, FieldType
 from .statistics import StatisticsCalculator
 from .charts import ChartGenerator
 
+# Normalizes known lowercase suffixes to their file-type labels; unknown
+# suffixes fall back to the bare extension in _get_file_type
+_SUFFIX_MAP = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.xlsx': 'xlsx',
+    '.xls': 'xls',
+    '.parquet': 'parquet',
+}
+
 
 class DataAnalyzer:
     """Main class for analyzing flat files and generating comprehensive reports."""
     
-    def __init__(self, categorical_threshold: float = 0.1) -> None:
+    def __init__(
+        self,
+        categorical_threshold: float = 0.1,
+        streaming_row_threshold: int = 1_000_000
+    ) -> None:
         """
         Initialize the data analyzer.
-        
+
         Args:
             categorical_threshold: Threshold for determining categorical fields
+            streaming_row_threshold: Parquet files with more rows than this
+                are analyzed one column at a time instead of loaded whole
         """
+        self.streaming_row_threshold = streaming_row_threshold
         self.field_detector = FieldTypeDetector(categorical_threshold)
         self.stats_calculator = StatisticsCalculator()
         self.chart_generator = ChartGenerator()
         self._data: Optional[pd.DataFrame] = None
+        self._arrow: Optional[pa.Table] = None
+        self._value_counts_cache: Dict[str, pd.Series] = {}
+        self._null_counts: Optional[pd.Series] = None
+        self._rng = np.random.default_rng(42)
     
     def analyze_file(self, file_path: str) -> AnalysisResult:
         """
@@ -39,28 +74,59 @@ class DataAnalyzer:
             AnalysisResult object with complete analysis
         """
         start_time = time.time()
-        
-        # Load the data
-        self._data = self._load_data(file_path)
-        
-        # Analyze each field
-        field_analyses = []
-        for column in self._data.columns:
-            field_analysis = self._analyze_field(self._data[column], column)
-            field_analyses.append(field_analysis)
-        
+
+        # Large Parquet files are analyzed column-by-column so peak memory
+        # stays at one column instead of the whole table
+        path = Path(file_path)
+        if path.suffix.lower() == '.parquet' and path.exists():
+            parquet_file = pq.ParquetFile(path)
+            if parquet_file.metadata.num_rows > self.streaming_row_threshold:
+                return self._analyze_parquet_streaming(parquet_file, file_path, start_time)
+
+        # Load the data; local bindings keep the Optional attributes
+        # narrowed inside the executor lambda below
+        data = self._data = self._load_data(file_path)
+        self._value_counts_cache = {}
+
+        # One vectorized null-count pass over the whole frame; per-field
+        # analysis, the total, and the missing-data summary chart all
+        # reuse it instead of re-traversing null masks
+        null_counts = self._null_counts = data.isna().sum()
+
+        # Classify every column in one pass over the dtype table; only
+        # object-like columns pay for the per-column heuristics
+        field_types = self.field_detector.detect_field_types(data)
+
+        # Encode after detection: the boolean/datetime heuristics need to
+        # see the raw string dtypes, not the category codes
+        self._encode_categoricals(data)
+
+        # Analyze each field. Columns are independent and the underlying
+        # pandas/NumPy reductions release the GIL, so a thread pool scales
+        # across cores on wide tables; map() preserves column order.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            field_analyses = list(executor.map(
+                lambda column: self._analyze_field(
+                    data[column], column,
+                    missing_count=int(null_counts[column]),
+                    field_type=field_types[column]
+                ),
+                data.columns
+            ))
+
         processing_time = time.time() - start_time
-        
+
         # Create the analysis result
         result = AnalysisResult(
             file_path=file_path,
             file_type=self._get_file_type(file_path),
             total_rows=len(self._data),
             total_columns=len(self._data.columns),
+            total_missing=int(self._null_counts.sum()),
             fields=field_analyses,
             processing_time_seconds=round(processing_time, 2)
         )
-        
+
         return result
     
     def generate_charts(self, analysis_result: AnalysisResult) -> dict:
@@ -78,14 +144,22 @@ class DataAnalyzer:
         
         charts = {}
         
-        # Generate charts for each field
+        # Generate charts for each field, reusing value counts cached
+        # during analysis where available
         for field in analysis_result.fields:
-            field_chart = self.chart_generator.generate_field_chart(field, self._data[field.name])
+            field_chart = self.chart_generator.generate_field_chart(
+                field,
+                self._data[field.name],
+                value_counts=self._value_counts_cache.get(field.name)
+            )
             if field_chart:
                 charts[f"field_{field.name}"] = field_chart
         
-        # Generate summary charts
-        summary_charts = self.chart_generator.generate_summary_charts(analysis_result.fields, self._data)
+        # Generate summary charts, reusing the null counts computed
+        # during analysis
+        summary_charts = self.chart_generator.generate_summary_charts(
+            analysis_result.fields, self._data, null_counts=self._null_counts
+        )
         charts.update(summary_charts)
         
         return charts
@@ -93,33 +167,190 @@ class DataAnalyzer:
     def _load_data(self, file_path: str) -> pd.DataFrame:
         """
         Load data from file based on its extension.
-        
+
+        CSV and Parquet files are read with PyArrow and converted to
+        Arrow-backed pandas dtypes, which keeps numeric columns zero-copy
+        and avoids python-object string columns on string-heavy files.
+
         Args:
             file_path: Path to the file
-            
+
         Returns:
             Pandas DataFrame
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        if file_path.suffix.lower() == '.csv':
-            return pd.read_csv(file_path)
-        elif file_path.suffix.lower() == '.json':
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        reader = self._READERS.get(path.suffix.lower())
+        if reader is not None:
+            return reader(self, path)
+
+        # Try to read as CSV by default
+        try:
+            table = pyarrow.csv.read_csv(path)
+            return self._table_to_pandas(table)
+        except Exception:
+            raise ValueError(f"Unsupported file format: {path.suffix}")
+
+    def _read_csv(self, file_path: Path) -> pd.DataFrame:
+        """Read a CSV file through PyArrow with dictionary-encoded strings."""
+        table = pyarrow.csv.read_csv(
+            file_path,
+            convert_options=pyarrow.csv.ConvertOptions(auto_dict_encode=True)
+        )
+        return self._table_to_pandas(table)
+
+    def _read_json(self, file_path: Path) -> pd.DataFrame:
+        """Read a JSON file, preferring PyArrow's NDJSON reader."""
+        try:
+            table = pyarrow.json.read_json(file_path)
+            return self._table_to_pandas(table)
+        except pa.ArrowInvalid:
+            # pyarrow.json only supports newline-delimited JSON, so
+            # fall back to pandas for the JSON-array layout
             return pd.read_json(file_path)
-        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
+
+    def _read_excel(self, file_path: Path) -> pd.DataFrame:
+        """Read an Excel file, preferring the calamine engine."""
+        try:
+            # calamine parses spreadsheets far faster than openpyxl;
+            # it's an optional dependency (the 'fast' extra)
+            return pd.read_excel(file_path, engine='calamine')
+        except ImportError:
             return pd.read_excel(file_path)
-        elif file_path.suffix.lower() == '.parquet':
-            return pd.read_parquet(file_path)
-        else:
-            # Try to read as CSV by default
-            try:
-                return pd.read_csv(file_path)
-            except Exception:
-                raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+    def _read_parquet(self, file_path: Path) -> pd.DataFrame:
+        """Read a Parquet file through PyArrow."""
+        table = pq.read_table(file_path, use_threads=True)
+        return self._table_to_pandas(table)
+
+    # Reader dispatch by lowercase suffix, resolved once instead of an
+    # if/elif chain re-lowering the suffix per branch
+    _READERS = {
+        '.csv': _read_csv,
+        '.json': _read_json,
+        '.xlsx': _read_excel,
+        '.xls': _read_excel,
+        '.parquet': _read_parquet,
+    }
+
+    def _table_to_pandas(self, table: pa.Table, keep_arrow: bool = True) -> pd.DataFrame:
+        """
+        Convert an Arrow table to a DataFrame with Arrow-backed dtypes.
+
+        By default the table is kept on `self._arrow` so later passes can
+        reuse it without re-parsing the file; the streaming Parquet path
+        passes keep_arrow=False since it only holds one column at a time.
+
+        Args:
+            table: PyArrow Table to convert
+            keep_arrow: Whether to retain the table on the analyzer
+
+        Returns:
+            Pandas DataFrame backed by Arrow arrays
+        """
+        # Promote plain date columns to timestamps so datetime handling
+        # downstream sees proper datetime values
+        fields = [
+            field.with_type(pa.timestamp('s')) if pa.types.is_date(field.type) else field
+            for field in table.schema
+        ]
+        table = table.cast(pa.schema(fields))
+
+        if keep_arrow:
+            self._arrow = table
+        return table.to_pandas(
+            types_mapper=pd.ArrowDtype,
+            split_blocks=True,
+            use_threads=True
+        )
+
+    def _analyze_parquet_streaming(
+        self,
+        parquet_file: pq.ParquetFile,
+        file_path: str,
+        start_time: float
+    ) -> AnalysisResult:
+        """
+        Analyze a Parquet file one column at a time.
+
+        Each column is read on its own (pruning the rest of the file) and
+        released once its FieldAnalysis is built, so peak memory stays at
+        one column rather than the full table. Only the first row group is
+        materialized as `self._data`, which sample tables and charts then
+        draw from.
+
+        Args:
+            parquet_file: Open ParquetFile to analyze
+            file_path: Path to the file (recorded in the result)
+            start_time: Timestamp when analysis started
+
+        Returns:
+            AnalysisResult object with complete analysis
+        """
+        self._value_counts_cache = {}
+        column_names = parquet_file.schema_arrow.names
+
+        field_analyses = []
+        null_counts: Dict[str, int] = {}
+        for column in column_names:
+            table = parquet_file.read(columns=[column], use_threads=True)
+            series = self._table_to_pandas(table, keep_arrow=False)[column]
+            missing_count = int(series.isna().sum())
+            null_counts[column] = missing_count
+            field_analyses.append(
+                self._analyze_field(series, column, missing_count=missing_count)
+            )
+        self._null_counts = pd.Series(null_counts)
+
+        # Keep a bounded slice for get_sample() and chart generation
+        self._data = self._table_to_pandas(
+            parquet_file.read_row_group(0), keep_arrow=False
+        )
+
+        processing_time = time.time() - start_time
+
+        return AnalysisResult(
+            file_path=file_path,
+            file_type=self._get_file_type(file_path),
+            total_rows=parquet_file.metadata.num_rows,
+            total_columns=len(column_names),
+            total_missing=int(self._null_counts.sum()),
+            fields=field_analyses,
+            processing_time_seconds=round(processing_time, 2)
+        )
     
+    def _encode_categoricals(self, data: pd.DataFrame) -> None:
+        """
+        Dictionary-encode low-cardinality string columns as category dtype.
+
+        String columns (object- or Arrow-backed alike) get re-hashed by
+        every value_counts/unique call downstream; converting them to
+        category once means those reductions run on small integer codes
+        instead. Cardinality is estimated on a head sample so wide files
+        don't pay a full scan per column. Must run after type detection,
+        whose string heuristics gate on the original dtypes.
+
+        Args:
+            data: DataFrame to encode in place
+        """
+        sample = data.head(10000)
+
+        for column in data.columns:
+            dtype = data[column].dtype
+            if isinstance(dtype, pd.CategoricalDtype) or not is_string_like(dtype):
+                continue
+
+            sample_values = sample[column].dropna()
+            if len(sample_values) == 0:
+                continue
+
+            unique_ratio = sample_values.nunique() / len(sample_values)
+            if unique_ratio <= self.field_detector.categorical_threshold:
+                data[column] = data[column].astype('category')
+
     def _get_file_type(self, file_path: str) -> str:
         """
         Get the file type based on extension.
@@ -130,54 +361,67 @@ class DataAnalyzer:
         Returns:
             File type string
         """
-        return Path(file_path).suffix.lower().lstrip('.')
+        # Path.suffix only looks at the final component, so dotted
+        # directories and dotfiles both come back as no extension
+        suffix = Path(file_path).suffix.lower()
+        return _SUFFIX_MAP.get(suffix, suffix.lstrip('.'))
     
-    def _analyze_field(self, series: pd.Series, column_name: str) -> FieldAnalysis:
+    def _analyze_field(
+        self,
+        series: pd.Series,
+        column_name: str,
+        missing_count: Optional[int] = None,
+        field_type: Optional[FieldType] = None
+    ) -> FieldAnalysis:
         """
         Analyze a single field/column.
-        
+
         Args:
             series: Pandas Series to analyze
             column_name: Name of the column
-            
+            missing_count: Precomputed number of missing values, if already known
+            field_type: Precomputed field type, if already known
+
         Returns:
             FieldAnalysis object
         """
-        # Detect field type
-        field_type = self.field_detector.detect_field_type(series)
-        
+        # Compute the null mask once (or trust the caller's precomputed
+        # count) and share it across the whole field analysis, so type
+        # detection, sampling, and statistics don't each re-scan the column
+        if missing_count is None:
+            missing_count = int(series.isna().sum())
+        non_null = series.dropna() if missing_count else series
+
+        # Detect field type unless the caller classified it already
+        if field_type is None:
+            field_type = self.field_detector.detect_field_type(series)
+
         # Get sample values
-        sample_values = get_sample_values(series)
-        
+        sample_values = get_sample_values(non_null)
+
         # Calculate statistics based on field type
-        categorical_stats = None
-        numerical_stats = None
-        string_stats = None
-        datetime_stats = None
-        
-        if field_type == FieldType.CATEGORICAL:
-            categorical_stats = self.stats_calculator.calculate_categorical_stats(series)
+        stats: Optional[FieldStats] = None
+        if field_type in [FieldType.CATEGORICAL, FieldType.BOOLEAN, FieldType.ID]:
+            # Booleans and IDs are treated as categorical for statistics.
+            # The value counts are cached so chart generation can reuse
+            # them instead of re-hashing the column.
+            value_counts = series.value_counts()
+            self._value_counts_cache[column_name] = value_counts
+            stats = self.stats_calculator.calculate_categorical_stats(
+                series, missing_count=missing_count, value_counts=value_counts
+            )
         elif field_type in [FieldType.INTEGER, FieldType.FLOAT]:
-            numerical_stats = self.stats_calculator.calculate_numerical_stats(series)
+            stats = self.stats_calculator.calculate_numerical_stats(series, missing_count=missing_count)
         elif field_type == FieldType.STRING:
-            string_stats = self.stats_calculator.calculate_string_stats(series)
+            stats = self.stats_calculator.calculate_string_stats(series, missing_count=missing_count)
         elif field_type == FieldType.DATETIME:
-            datetime_stats = self.stats_calculator.calculate_datetime_stats(series)
-        elif field_type == FieldType.BOOLEAN:
-            # Treat boolean as categorical for statistics
-            categorical_stats = self.stats_calculator.calculate_categorical_stats(series)
-        elif field_type == FieldType.ID:
-            # Treat ID as categorical for statistics (since IDs are unique identifiers)
-            categorical_stats = self.stats_calculator.calculate_categorical_stats(series)
-        
+            stats = self.stats_calculator.calculate_datetime_stats(series, missing_count=missing_count)
+
         return FieldAnalysis(
             name=column_name,
             field_type=field_type,
             total_count=len(series),
-            categorical_stats=categorical_stats,
-            numerical_stats=numerical_stats,
-            string_stats=string_stats,
-            datetime_stats=datetime_stats,
+            stats=stats,
             sample_values=sample_values
         )
     
@@ -189,8 +433,12 @@ class DataAnalyzer:
             analysis_result: AnalysisResult object to save
             output_path: Path where to save the JSON file
         """
-        with open(output_path, 'w') as f:
-            json.dump(analysis_result.model_dump(), f, indent=2, default=str)
+        # model_dump_json serializes straight from the model in Rust,
+        # skipping the intermediate Python dict a model_dump + json/orjson
+        # round would build
+        Path(output_path).write_bytes(
+            analysis_result.model_dump_json(indent=2).encode()
+        )
     
     def load_analysis_from_json(self, json_path: str) -> AnalysisResult:
         """
@@ -202,9 +450,9 @@ class DataAnalyzer:
         Returns:
             AnalysisResult object
         """
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        
+        raw = Path(json_path).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
         return AnalysisResult.model_validate(data)
     
     def get_sample(self, n: int = 5, sample_type: str = 'head') -> Optional[pd.DataFrame]:
@@ -219,6 +467,11 @@ class DataAnalyzer:
         if self._data is None:
             return None
         if sample_type == 'random':
-            return self._data.sample(n=min(n, len(self._data)), random_state=42)
+            # Index directly with the cached generator rather than
+            # pd.DataFrame.sample, which permutes the full index each
+            # call; replace=False keeps rows distinct like sample did
+            total_rows = len(self._data)
+            indices = self._rng.choice(total_rows, size=min(n, total_rows), replace=False)
+            return self._data.take(indices)
         else:
             return self._data.head(n) 
\ No newline at end of file
@@ -1,255 +1,402 @@
 """Chart generation for data analysis results."""
 
+import json
+import os
+from datetime import datetime
+from itertools import count
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 
 from .models import FieldAnalysis, FieldType
 
+# Qualitative palette (Plotly's Set3) used for summary pie charts; kept as a
+# literal so chart generation doesn't need plotly.express at all
+_QUALITATIVE_COLORS = [
+    'rgb(141,211,199)', 'rgb(255,255,179)', 'rgb(190,186,218)',
+    'rgb(251,128,114)', 'rgb(128,177,211)', 'rgb(253,180,98)',
+    'rgb(179,222,105)', 'rgb(252,205,229)', 'rgb(217,217,217)',
+    'rgb(188,128,189)', 'rgb(204,235,197)', 'rgb(255,237,111)',
+]
+
+
+def _non_null_float_array(data: pd.Series) -> np.ndarray:
+    """
+    Extract the non-null values of a series as a float64 array.
+
+    Arrow-backed columns are drained through their Arrow buffer
+    (drop_null on the chunked array), which avoids materializing a
+    pandas intermediate and is zero-copy for numeric data without
+    nulls. Other dtypes fall back to dropna + to_numpy.
+    """
+    pa_array = getattr(data.array, '_pa_array', None)
+    if pa_array is not None:
+        values = pa_array.drop_null().to_numpy(zero_copy_only=False)
+        return np.asarray(values, dtype='float64')
+    return np.asarray(data.dropna().to_numpy(dtype='float64'))
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize numpy/pandas values that json.dumps doesn't know about."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, pd.Index):
+        return obj.tolist()
+    if isinstance(obj, (pd.Timestamp, datetime)):
+        return obj.isoformat()
+    return str(obj)
+
 
 class ChartGenerator:
     """Generates appropriate charts for different field types."""
-    
-    def __init__(self) -> None:
-        """Initialize the chart generator."""
-        pass
-    
-    def generate_field_chart(self, field: FieldAnalysis, data: pd.Series) -> Optional[str]:
+
+    def __init__(self, mode: Optional[str] = None) -> None:
         """
-        Generate an appropriate chart for a field based on its type.
-        
+        Initialize the chart generator.
+
+        Args:
+            mode: 'full' renders real chart HTML (the default); 'stub'
+                returns a tiny placeholder div carrying the trace kind,
+                skipping the JSON serialization of the figure data.
+                Defaults to the ELI5_CHART_MODE environment variable,
+                which lets test runs opt out of full rendering globally.
+        """
+        self.mode = mode if mode is not None else os.environ.get('ELI5_CHART_MODE', 'full')
+        self._chart_ids = count()
+
+    def _render_figure(self, spec: Dict[str, Any]) -> str:
+        """
+        Render a Plotly figure spec as a chart div plus a Plotly.newPlot call.
+
+        The spec is a plain data/layout dict serialized straight to JSON.
+        Building charts this way bypasses the graph_objects validators,
+        which dominate chart generation time on wide datasets, and avoids
+        repeating the full Plotly wrapper per chart.
+
+        Args:
+            spec: Figure spec with 'data' and 'layout' keys
+
+        Returns:
+            HTML snippet containing the chart
+        """
+        if self.mode == 'stub':
+            kind = spec["data"][0]["type"]
+            return f'<div class="plotly-graph-div" data-kind="{kind}"></div>'
+        chart_id = f"eli5-chart-{next(self._chart_ids)}"
+        chart_json = json.dumps(spec, default=_json_default)
+        return (
+            f'<div id="{chart_id}"></div>'
+            f'<script>(function(){{var fig={chart_json};'
+            f'Plotly.newPlot("{chart_id}",fig.data,fig.layout,'
+            f'window.ELI5_PLOTLY_CONFIG||{{"responsive":true}});}})();</script>'
+        )
+
+    def generate_field_spec(
+        self,
+        field: FieldAnalysis,
+        data: pd.Series,
+        value_counts: Optional[pd.Series] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the Plotly figure spec for a field based on its type.
+
+        Exposed separately from generate_field_chart so callers (and
+        tests) can inspect the data/layout dict without paying for the
+        HTML rendering step.
+
         Args:
             field: FieldAnalysis object
             data: Pandas Series containing the data
-            
+            value_counts: Precomputed value counts for the series, if already known
+
         Returns:
-            HTML string containing the chart or None if no chart can be generated
+            Figure spec dict or None if no chart applies (ID/unknown
+            fields, near-unique categoricals, or empty data)
         """
         if field.field_type == FieldType.CATEGORICAL:
-            return self._generate_categorical_chart(field, data)
+            # Near-unique columns (emails, free text misclassified as
+            # categorical) produce meaningless bar charts; skip them and
+            # spare the figure/HTML cost
+            unique_count = (
+                len(value_counts) if value_counts is not None
+                else data.nunique(dropna=True)
+            )
+            if unique_count > min(50, 0.5 * len(data)):
+                return None
+            return self._categorical_spec(field, data, value_counts)
         elif field.field_type in [FieldType.INTEGER, FieldType.FLOAT]:
-            return self._generate_numerical_chart(field, data)
+            return self._numerical_spec(field, data)
         elif field.field_type == FieldType.DATETIME:
-            return self._generate_datetime_chart(field, data)
+            return self._datetime_spec(field, data)
         elif field.field_type == FieldType.BOOLEAN:
-            return self._generate_boolean_chart(field, data)
+            return self._boolean_spec(field, data, value_counts)
         elif field.field_type == FieldType.ID:
             # Skip charts for ID fields as they don't provide meaningful insights
             return None
         else:
             return None
-    
-    def _generate_categorical_chart(self, field: FieldAnalysis, data: pd.Series) -> str:
-        """Generate a bar chart for categorical data."""
+
+    def generate_field_chart(
+        self,
+        field: FieldAnalysis,
+        data: pd.Series,
+        value_counts: Optional[pd.Series] = None
+    ) -> Optional[str]:
+        """
+        Generate an appropriate chart for a field based on its type.
+
+        Args:
+            field: FieldAnalysis object
+            data: Pandas Series containing the data
+            value_counts: Precomputed value counts for the series, if already known
+
+        Returns:
+            HTML string containing the chart or None if no chart can be generated
+        """
+        spec = self.generate_field_spec(field, data, value_counts)
+        if spec is not None:
+            return self._render_figure(spec)
+        # Numerical/datetime fields with no non-null data keep their
+        # placeholder; other chartless fields stay None
+        if field.field_type in [FieldType.INTEGER, FieldType.FLOAT, FieldType.DATETIME]:
+            return "<p>No data available for chart</p>"
+        return None
+
+    def _categorical_spec(
+        self,
+        field: FieldAnalysis,
+        data: pd.Series,
+        value_counts: Optional[pd.Series] = None
+    ) -> Dict[str, Any]:
+        """Build a bar-chart spec for categorical data."""
         # Get value counts for top 15 values
-        value_counts = data.value_counts().head(15)
-        
-        # Convert to lists explicitly
-        categories = value_counts.index.tolist()
-        counts = value_counts.values.tolist()
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=counts,
-            y=categories,
-            orientation='h',
-            marker_color='#667eea',
-            text=counts,
-            textposition='auto',
-        ))
-        
-        fig.update_layout(
-            title=f"Distribution of {field.name}",
-            xaxis_title="Count",
-            yaxis_title=field.name,
-            height=400,
-            showlegend=False,
-            margin=dict(l=20, r=20, t=40, b=20),
-        )
-        
-        return fig.to_html(include_plotlyjs=False, full_html=False)
-    
-    def _generate_numerical_chart(self, field: FieldAnalysis, data: pd.Series) -> str:
-        """Generate a histogram for numerical data."""
-        # Remove NaN values and convert to list
-        clean_data = data.dropna().tolist()
-        
+        if value_counts is None:
+            value_counts = data.value_counts()
+        value_counts = value_counts.head(15)
+
+        # Hand the arrays straight to the JSON encoder rather than
+        # unboxing element-by-element with .tolist()
+        categories = value_counts.index.to_numpy()
+        counts = value_counts.to_numpy()
+
+        spec = {
+            "data": [{
+                "type": "bar",
+                "x": counts,
+                "y": categories,
+                "orientation": "h",
+                "marker": {"color": '#667eea'},
+                "text": counts,
+                "textposition": "auto",
+            }],
+            "layout": {
+                "title": f"Distribution of {field.name}",
+                "xaxis": {"title": "Count"},
+                "yaxis": {"title": field.name},
+                "height": 400,
+                "showlegend": False,
+                "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+            },
+        }
+
+        return spec
+
+    def _numerical_spec(self, field: FieldAnalysis, data: pd.Series) -> Optional[Dict[str, Any]]:
+        """Build a histogram spec for numerical data."""
+        # Remove NaN values and work on a plain float array
+        clean_data = _non_null_float_array(data)
+
         if len(clean_data) == 0:
-            return "<p>No data available for chart</p>"
-        
-        fig = go.Figure()
-        fig.add_trace(go.Histogram(
-            x=clean_data,
-            nbinsx=30,
-            marker_color='#667eea',
-            opacity=0.7,
-        ))
-        
-        fig.update_layout(
-            title=f"Distribution of {field.name}",
-            xaxis_title=field.name,
-            yaxis_title="Frequency",
-            height=400,
-            showlegend=False,
-            margin=dict(l=20, r=20, t=40, b=20),
-        )
-        
-        return fig.to_html(include_plotlyjs=False, full_html=False)
-    
-    def _generate_datetime_chart(self, field: FieldAnalysis, data: pd.Series) -> str:
-        """Generate a histogram for datetime data with intelligent binning."""
-        # Convert to datetime if not already
-        if not pd.api.types.is_datetime64_any_dtype(data):
-            datetime_data = pd.to_datetime(data, errors='coerce')
-        else:
-            datetime_data = data
-        
+            return None
+
+        # Pre-bin in Python so the HTML carries 30 bars instead of every
+        # raw value, and the browser doesn't have to re-bin
+        counts, edges = np.histogram(clean_data, bins=30)
+
+        spec = {
+            "data": [{
+                "type": "bar",
+                "x": (edges[:-1] + edges[1:]) / 2,
+                "y": counts,
+                "width": np.diff(edges),
+                "marker": {"color": '#667eea'},
+                "opacity": 0.7,
+            }],
+            "layout": {
+                "title": f"Distribution of {field.name}",
+                "xaxis": {"title": field.name},
+                "yaxis": {"title": "Frequency"},
+                "height": 400,
+                "showlegend": False,
+                "bargap": 0,
+                "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+            },
+        }
+
+        return spec
+
+    def _datetime_spec(self, field: FieldAnalysis, data: pd.Series) -> Optional[Dict[str, Any]]:
+        """Build a histogram spec for datetime data with intelligent binning."""
+        # Convert to numpy-backed datetime64: Arrow-backed timestamps can
+        # survive to_datetime unchanged but don't support the .dt.to_period
+        # accessor used below
+        datetime_data = pd.to_datetime(data, errors='coerce')
+        if not pd.api.types.is_datetime64_dtype(datetime_data):
+            datetime_data = datetime_data.astype('datetime64[ns]')
+
         # Remove NaN values
         clean_data = datetime_data.dropna()
-        
+
         if len(clean_data) == 0:
-            return "<p>No data available for chart</p>"
-        
+            return None
+
         # Determine appropriate binning based on data range
         min_date = clean_data.min()
         max_date = clean_data.max()
         date_range = max_date - min_date
-        
-        # Convert to list for Plotly
-        dates_list = clean_data.tolist()
-        
-        fig = go.Figure()
-        
+
         # Determine binning strategy
         if date_range.days <= 31:
             # Less than a month - bin by day
-            fig.add_trace(go.Histogram(
-                x=dates_list,
-                nbinsx=min(30, len(clean_data.unique())),
-                marker_color='#667eea',
-                opacity=0.7,
-            ))
+            n_bins = min(30, len(clean_data.unique()))
             bin_type = "day"
         elif date_range.days <= 365:
             # Less than a year - bin by month
-            fig.add_trace(go.Histogram(
-                x=dates_list,
-                nbinsx=min(12, len(clean_data.dt.to_period('M').unique())),
-                marker_color='#667eea',
-                opacity=0.7,
-            ))
+            n_bins = min(12, len(clean_data.dt.to_period('M').unique()))
             bin_type = "month"
         else:
             # More than a year - bin by year
-            fig.add_trace(go.Histogram(
-                x=dates_list,
-                nbinsx=min(10, len(clean_data.dt.to_period('Y').unique())),
-                marker_color='#667eea',
-                opacity=0.7,
-            ))
+            n_bins = min(10, len(clean_data.dt.to_period('Y').unique()))
             bin_type = "year"
-        
-        fig.update_layout(
-            title=f"Distribution of {field.name} (binned by {bin_type})",
-            xaxis_title=field.name,
-            yaxis_title="Frequency",
-            height=400,
-            showlegend=False,
-            margin=dict(l=20, r=20, t=40, b=20),
-        )
-        
-        return fig.to_html(include_plotlyjs=False, full_html=False)
-    
-    def _generate_boolean_chart(self, field: FieldAnalysis, data: pd.Series) -> str:
-        """Generate a pie chart for boolean data."""
+
+        # Pre-bin on int64 nanoseconds so the HTML carries the bars, not
+        # every raw timestamp
+        nanos = clean_data.to_numpy(dtype='datetime64[ns]').view('i8')
+        counts, edges = np.histogram(nanos, bins=n_bins)
+        centers = pd.to_datetime(((edges[:-1] + edges[1:]) / 2).astype('int64'), unit='ns')
+
+        spec = {
+            "data": [{
+                "type": "bar",
+                "x": centers,
+                "y": counts,
+                # Plotly bar widths on a date axis are in milliseconds
+                "width": np.diff(edges) / 1e6,
+                "marker": {"color": '#667eea'},
+                "opacity": 0.7,
+            }],
+            "layout": {
+                "title": f"Distribution of {field.name} (binned by {bin_type})",
+                "xaxis": {"title": field.name},
+                "yaxis": {"title": "Frequency"},
+                "height": 400,
+                "showlegend": False,
+                "bargap": 0,
+                "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+            },
+        }
+
+        return spec
+
+    def _boolean_spec(
+        self,
+        field: FieldAnalysis,
+        data: pd.Series,
+        value_counts: Optional[pd.Series] = None
+    ) -> Dict[str, Any]:
+        """Build a pie-chart spec for boolean data."""
         # Get value counts
-        value_counts = data.value_counts()
-        
-        # Convert to lists explicitly
-        labels = value_counts.index.tolist()
-        values = value_counts.values.tolist()
-        
-        fig = go.Figure()
-        fig.add_trace(go.Pie(
-            labels=labels,
-            values=values,
-            marker_colors=['#28a745', '#dc3545'],
-        ))
-        
-        fig.update_layout(
-            title=f"Distribution of {field.name}",
-            height=400,
-            showlegend=True,
-            margin=dict(l=20, r=20, t=40, b=20),
-        )
-        
-        return fig.to_html(include_plotlyjs=False, full_html=False)
-    
-    def generate_summary_charts(self, fields: List[FieldAnalysis], data: pd.DataFrame) -> Dict[str, str]:
+        if value_counts is None:
+            value_counts = data.value_counts()
+
+        labels = value_counts.index.to_numpy()
+        values = value_counts.to_numpy()
+
+        spec = {
+            "data": [{
+                "type": "pie",
+                "labels": labels,
+                "values": values,
+                "marker": {"colors": ['#28a745', '#dc3545']},
+            }],
+            "layout": {
+                "title": f"Distribution of {field.name}",
+                "height": 400,
+                "showlegend": True,
+                "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+            },
+        }
+
+        return spec
+
+    def generate_summary_charts(
+        self,
+        fields: List[FieldAnalysis],
+        data: pd.DataFrame,
+        null_counts: Optional[pd.Series] = None
+    ) -> Dict[str, str]:
         """
         Generate summary charts for the dataset.
-        
+
         Args:
             fields: List of FieldAnalysis objects
             data: Pandas DataFrame containing the data
-            
+            null_counts: Precomputed per-column null counts, if already known
+
         Returns:
             Dictionary mapping chart names to HTML strings
         """
         charts = {}
-        
+
         # Field type distribution
         field_types = [field.field_type.value for field in fields]
         type_counts = pd.Series(field_types).value_counts()
-        
-        # Convert to lists explicitly
-        type_labels = type_counts.index.tolist()
-        type_values = type_counts.values.tolist()
-        
-        fig = go.Figure()
-        fig.add_trace(go.Pie(
-            labels=type_labels,
-            values=type_values,
-            marker_colors=px.colors.qualitative.Set3,
-        ))
-        
-        fig.update_layout(
-            title="Field Type Distribution",
-            height=400,
-            showlegend=True,
-            margin=dict(l=20, r=20, t=40, b=20),
-        )
-        
-        charts['field_types'] = fig.to_html(include_plotlyjs=False, full_html=False)
-        
+
+        spec = {
+            "data": [{
+                "type": "pie",
+                "labels": type_counts.index.to_numpy(),
+                "values": type_counts.to_numpy(),
+                "marker": {"colors": _QUALITATIVE_COLORS},
+            }],
+            "layout": {
+                "title": "Field Type Distribution",
+                "height": 400,
+                "showlegend": True,
+                "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+            },
+        }
+
+        charts['field_types'] = self._render_figure(spec)
+
         # Missing data heatmap
-        missing_data = data.isnull().sum()
+        missing_data = null_counts if null_counts is not None else data.isnull().sum()
         if missing_data.sum() > 0:
-            # Convert to lists explicitly
-            field_names = missing_data.index.tolist()
-            missing_counts = missing_data.values.tolist()
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=field_names,
-                y=missing_counts,
-                marker_color='#ffc107',
-                text=missing_counts,
-                textposition='auto',
-            ))
-            
-            fig.update_layout(
-                title="Missing Data by Field",
-                xaxis_title="Fields",
-                yaxis_title="Missing Count",
-                height=400,
-                showlegend=False,
-                margin=dict(l=20, r=20, t=40, b=20),
-            )
-            
-            charts['missing_data'] = fig.to_html(include_plotlyjs=False, full_html=False)
-        
-        return charts 
\ No newline at end of file
+            field_names = missing_data.index.to_numpy()
+            missing_counts = missing_data.to_numpy()
+
+            spec = {
+                "data": [{
+                    "type": "bar",
+                    "x": field_names,
+                    "y": missing_counts,
+                    "marker": {"color": '#ffc107'},
+                    "text": missing_counts,
+                    "textposition": "auto",
+                }],
+                "layout": {
+                    "title": "Missing Data by Field",
+                    "xaxis": {"title": "Fields"},
+                    "yaxis": {"title": "Missing Count"},
+                    "height": 400,
+                    "showlegend": False,
+                    "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+                },
+            }
+
+            charts['missing_data'] = self._render_figure(spec)
+
+        return charts
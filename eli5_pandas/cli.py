@@ -1,12 +1,14 @@
 """Command-line interface for ELI5 Pandas."""
 
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
 import click
 
 from .analyzer import DataAnalyzer
+from .models import AnalysisResult
 from .reporter import HTMLReporter
 
 
@@ -267,7 +269,7 @@ def quick_analyze(
         sys.exit(1)
 
 
-def _display_summary(analysis_result) -> None:
+def _display_summary(analysis_result: AnalysisResult) -> None:
     """Display a summary of the analysis results."""
     click.echo("\n" + "="*60)
     click.echo("📊 ANALYSIS SUMMARY")
@@ -279,24 +281,15 @@ def _display_summary(analysis_result) -> None:
     click.echo(f"⚡ Processing time: {analysis_result.processing_time_seconds}s")
     
     # Field type breakdown
-    type_counts = {}
-    for field in analysis_result.fields:
-        field_type = field.field_type.value
-        type_counts[field_type] = type_counts.get(field_type, 0) + 1
-    
+    type_counts = Counter(field.field_type.value for field in analysis_result.fields)
+
     click.echo("\n📊 Field Types:")
     for field_type, count in sorted(type_counts.items()):
         click.echo(f"   • {field_type.title()}: {count}")
     
-    # Data quality summary
-    total_missing = sum(
-        field.categorical_stats.missing_count if field.categorical_stats else 0
-        or field.numerical_stats.missing_count if field.numerical_stats else 0
-        or field.string_stats.missing_count if field.string_stats else 0
-        or field.datetime_stats.missing_count if field.datetime_stats else 0
-        for field in analysis_result.fields
-    )
-    
+    # Data quality summary (computed once, vectorized, during analysis)
+    total_missing = analysis_result.total_missing
+
     total_cells = analysis_result.total_rows * analysis_result.total_columns
     completeness = ((total_cells - total_missing) / total_cells * 100) if total_cells > 0 else 0
     
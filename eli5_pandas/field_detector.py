@@ -1,18 +1,190 @@
 """Field type detection and analysis utilities."""
 
+import random
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from .models import FieldType
 
+try:
+    # DFA-based engine with a re-compatible API; no backtracking blowups
+    # on hostile column names (the 'fast' extra)
+    import re2 as _regex  # type: ignore[import-not-found]
+except ImportError:
+    _regex = re
+
+# Enum members hoisted to module scope so the hot classification path
+# returns them without an enum descriptor lookup per column
+_FT_UNKNOWN = FieldType.UNKNOWN
+_FT_ID = FieldType.ID
+_FT_BOOLEAN = FieldType.BOOLEAN
+_FT_DATETIME = FieldType.DATETIME
+_FT_INTEGER = FieldType.INTEGER
+_FT_FLOAT = FieldType.FLOAT
+_FT_CATEGORICAL = FieldType.CATEGORICAL
+_FT_STRING = FieldType.STRING
+
+# Column-name patterns that suggest ID fields, compiled once at import as a
+# single alternation: exact 'id'/'uuid'/'pk', *_id / id_* affixes, and names
+# containing 'identifier'/'uuid' or ending in 'key'/'code'/'pk'
+_ID_NAME_RE = _regex.compile(
+    r'^(?:id|.*_id|id_.*|.*identifier.*|.*key|.*code|uuid|.*uuid.*|pk|.*pk)$',
+    re.IGNORECASE,
+)
+
+# Kept on the stdlib engine: pandas' Series.str.match only accepts
+# re.Pattern objects
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE,
+)
+
+# String spellings accepted as boolean values
+_BOOL_SET = frozenset({
+    'true', 'false', 'yes', 'no', '1', '0',
+    't', 'f', 'y', 'n', 'on', 'off',
+})
+
+
+def _all_integers(values: np.ndarray) -> bool:
+    """
+    Check whether every value in a float64 array is integral.
+
+    Written as an early-exit scalar loop so it JIT-compiles to native code
+    when numba is installed (the 'fast' extra); a vectorized NumPy reduction
+    stands in otherwise.
+    """
+    for i in range(values.shape[0]):
+        if values[i] != np.floor(values[i]):
+            return False
+    return True
+
+
+try:
+    from numba import njit
+
+    _all_integers = njit(cache=True, fastmath=True)(_all_integers)
+    # Warm the JIT once at import so the first detected column doesn't
+    # pay the compile cost
+    _all_integers(np.array([0.0]))
+except ImportError:
+    def _all_integers(values: np.ndarray) -> bool:  # noqa: F811
+        """NumPy fallback: one C-loop reduction instead of a Python loop."""
+        return bool(np.all(np.mod(values, 1.0) == 0.0))
+
+
+def is_string_like(dtype: Any) -> bool:
+    """
+    Whether a dtype holds object or string values.
+
+    The parsing heuristics need to recognize string columns however they
+    are backed: plain object columns, pandas str/string dtypes, the Arrow
+    string and dictionary-of-string columns the PyArrow loaders produce,
+    and categoricals wrapping any of these.
+
+    Args:
+        dtype: Dtype of the column being classified
+
+    Returns:
+        True if the column's values are strings (or arbitrary objects)
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return is_string_like(dtype.categories.dtype)
+    if isinstance(dtype, pd.ArrowDtype):
+        pa_type = dtype.pyarrow_dtype
+        if pa.types.is_dictionary(pa_type):
+            pa_type = pa_type.value_type
+        return bool(pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type))
+    return bool(dtype == object or pd.api.types.is_string_dtype(dtype))
+
+
+@dataclass
+class _DetectCtx:
+    """
+    Per-column state shared by the type-detection helpers.
+
+    Built once per Series in detect_field_type so the expensive derived
+    values (unique values, coerced numeric array) are computed at most
+    once per column, however many helpers ask for them.
+    """
+
+    series: pd.Series
+    non_null: pd.Series
+    dtype_kind: str
+
+    @cached_property
+    def n(self) -> int:
+        """Number of non-null values."""
+        return len(self.non_null)
+
+    @cached_property
+    def string_like(self) -> bool:
+        """Whether the column holds string-like values (see is_string_like)."""
+        return is_string_like(self.series.dtype)
+
+    @cached_property
+    def unique(self) -> np.ndarray:
+        """Unique non-null values (one hash pass, reused by every caller)."""
+        return np.asarray(self.non_null.unique())
+
+    @cached_property
+    def unique_count(self) -> int:
+        """
+        Number of unique non-null values.
+
+        Uses nunique(), which counts without materializing the unique-value
+        array, unless that array has already been built anyway.
+        """
+        if 'unique' in self.__dict__:
+            return len(self.unique)
+        return int(self.non_null.nunique())
+
+    @cached_property
+    def float_values(self) -> np.ndarray:
+        """
+        Non-null values coerced to float64.
+
+        Values that fail to parse become NaN under errors='coerce' and are
+        masked out here, regardless of the backing dtype.
+        """
+        numeric_series = pd.to_numeric(self.non_null, errors='coerce')
+        arr: np.ndarray = numeric_series.to_numpy(dtype='float64', na_value=np.nan)
+        masked: np.ndarray = arr[~np.isnan(arr)]
+        return masked
+
+    @cached_property
+    def all_integral(self) -> Optional[bool]:
+        """
+        Whether every parseable numeric value is integral.
+
+        None when nothing parses as numeric. Cached so the integer and
+        float checks share one reduction instead of scanning twice.
+        """
+        if len(self.float_values) == 0:
+            return None
+        return bool(_all_integers(self.float_values))
+
 
 class FieldTypeDetector:
     """Detects the type of data in a pandas Series."""
-    
+
+    # Dtype kinds that decide the field type outright; object-like columns
+    # ('O') fall through to the parsing heuristics
+    _KIND_MAP = {
+        'b': _FT_BOOLEAN,
+        'i': _FT_INTEGER,
+        'u': _FT_INTEGER,
+        'f': _FT_FLOAT,
+        'M': _FT_DATETIME,
+    }
+
     def __init__(self, categorical_threshold: float = 0.1) -> None:
         """
         Initialize the field type detector.
@@ -33,78 +205,101 @@ class FieldTypeDetector:
         Returns:
             Detected FieldType
         """
-        # Remove NaN values for analysis
-        non_null_series = series.dropna()
-        
-        if len(non_null_series) == 0:
-            return FieldType.UNKNOWN
-        
+        # Drop nulls and classify the dtype once; every helper below reads
+        # from the shared context instead of re-running dropna/unique
+        ctx = _DetectCtx(
+            series=series,
+            non_null=series.dropna(),
+            dtype_kind=series.dtype.kind,
+        )
+
+        if ctx.n == 0:
+            return _FT_UNKNOWN
+
+        # Fast path: typed dtypes resolve straight from their kind before
+        # the data-scanning ID heuristics run. Booleans can never be IDs;
+        # other typed columns only need the ID check when the name matches.
+        kind_type = self._KIND_MAP.get(ctx.dtype_kind)
+        if kind_type is not None:
+            if ctx.dtype_kind == 'b' or not _ID_NAME_RE.match(str(series.name).lower()):
+                return kind_type
+
         # Check for ID type first (this should override other detections)
-        if self._is_id_field(series):
-            return FieldType.ID
-        
+        if self._is_id_field(ctx):
+            return _FT_ID
+
+        if kind_type is not None:
+            return kind_type
+
         # Check for boolean type
-        if self._is_boolean(series):
-            return FieldType.BOOLEAN
-        
+        if self._is_boolean(ctx):
+            return _FT_BOOLEAN
+
         # Check for datetime type
-        if self._is_datetime(series):
-            return FieldType.DATETIME
-        
+        if self._is_datetime(ctx):
+            return _FT_DATETIME
+
         # Check for integer type
-        if self._is_integer(series):
-            return FieldType.INTEGER
-        
+        if self._is_integer(ctx):
+            return _FT_INTEGER
+
         # Check for float type
-        if self._is_float(series):
-            return FieldType.FLOAT
-        
+        if self._is_float(ctx):
+            return _FT_FLOAT
+
         # Check for categorical type
-        if self._is_categorical(series):
-            return FieldType.CATEGORICAL
-        
+        if self._is_categorical(ctx):
+            return _FT_CATEGORICAL
+
         # Default to string
-        return FieldType.STRING
+        return _FT_STRING
+
+    def detect_field_types(self, df: pd.DataFrame) -> Dict[str, FieldType]:
+        """
+        Detect field types for every column of a DataFrame.
+
+        The dtype table is walked once: columns with a typed dtype are
+        classified directly from their kind, so only object-like columns
+        (and typed columns whose names look like IDs) pay for the
+        per-column heuristics in detect_field_type.
+
+        Args:
+            df: DataFrame whose columns should be classified
+
+        Returns:
+            Mapping of column name to detected FieldType
+        """
+        field_types: Dict[str, FieldType] = {}
+        for column, dtype in df.dtypes.items():
+            kind_type = self._KIND_MAP.get(dtype.kind)
+            if kind_type is None or _ID_NAME_RE.match(str(column).lower()):
+                field_types[column] = self.detect_field_type(df[column])
+            elif df[column].notna().any():
+                field_types[column] = kind_type
+            else:
+                field_types[column] = _FT_UNKNOWN
+        return field_types
     
-    def _is_id_field(self, series: pd.Series) -> bool:
+    def _is_id_field(self, ctx: _DetectCtx) -> bool:
         """
         Check if a field is an identifier column.
-        
+
         Args:
-            series: Pandas Series to analyze
-            
+            ctx: Shared detection context for the column
+
         Returns:
             True if the field appears to be an ID column
         """
-        column_name = series.name.lower()
-        non_null_series = series.dropna()
-        
-        if len(non_null_series) == 0:
-            return False
-        
-        # Check column name patterns that suggest ID fields
-        id_patterns = [
-            r'^id$',           # exact match for 'id'
-            r'^.*_id$',        # ends with '_id'
-            r'^id_.*$',        # starts with 'id_'
-            r'^.*identifier.*$', # contains 'identifier'
-            r'^.*key$',        # ends with 'key'
-            r'^.*code$',       # ends with 'code'
-            r'^uuid$',         # exact match for 'uuid'
-            r'^.*uuid.*$',     # contains 'uuid'
-            r'^pk$',           # primary key
-            r'^.*pk$',         # ends with 'pk'
-        ]
-        
-        # Check if column name matches any ID pattern
-        name_matches = any(re.match(pattern, column_name) for pattern in id_patterns)
-        
-        if not name_matches:
+        series = ctx.series
+
+        # The ID check is name-gated: bail on the (cheap) name regex before
+        # touching any column data. str() guards non-string column labels.
+        if not _ID_NAME_RE.match(str(series.name).lower()):
             return False
-        
+
         # Additional checks for ID characteristics
         total_count = len(series)
-        unique_count = len(non_null_series.unique())
+        unique_count = ctx.unique_count
         
         # ID fields should have high uniqueness (close to 100%)
         uniqueness_ratio = unique_count / total_count if total_count > 0 else 0
@@ -118,144 +313,120 @@ class FieldTypeDetector:
             return False
         
         # Check for UUID pattern if it's a string field
-        if series.dtype == 'object':
+        if ctx.string_like:
             # Sample some values to check for UUID pattern
-            sample_size = min(10, len(non_null_series))
-            sample = non_null_series.head(sample_size)
-            
-            uuid_pattern = re.compile(
-                r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-                re.IGNORECASE
-            )
-            
-            # If any sample looks like UUID, it's likely an ID
-            if any(uuid_pattern.match(str(val)) for val in sample):
+            sample_size = min(10, ctx.n)
+            sample = ctx.non_null.head(sample_size)
+
+            # If any sample looks like UUID, it's likely an ID; str.match
+            # runs the regex inside pandas rather than a Python loop
+            if bool(sample.astype(str).str.match(_UUID_RE).any()):
                 return True
         
         # For numeric IDs, check if they're sequential or have ID-like characteristics
         if pd.api.types.is_numeric_dtype(series):
             # Check if values are mostly sequential or have ID-like patterns
-            numeric_series = pd.to_numeric(series, errors='coerce').dropna()
-            if len(numeric_series) > 1:
+            values = ctx.float_values
+            if len(values) > 1:
                 # Check if values are positive and reasonable for IDs
-                if numeric_series.min() >= 0 and numeric_series.max() < 1e12:
+                if values.min() >= 0 and values.max() < 1e12:
                     return True
         
         return True
     
-    def _is_boolean(self, series: pd.Series) -> bool:
+    def _is_boolean(self, ctx: _DetectCtx) -> bool:
         """Check if series contains boolean values."""
-        # Check if all non-null values are boolean-like
-        non_null = series.dropna()
-        if len(non_null) == 0:
-            return False
-        
-        # Check for pandas boolean type
-        if series.dtype == 'bool':
+        # Check for pandas boolean type (covers numpy and Arrow-backed bools)
+        if pd.api.types.is_bool_dtype(ctx.series):
             return True
-        
+
         # Check for string representations of booleans
-        if series.dtype == 'object':
-            bool_patterns = {
-                'true', 'false', 'yes', 'no', '1', '0', 
-                't', 'f', 'y', 'n', 'on', 'off'
-            }
-            unique_values = set(str(val).lower().strip() for val in non_null)
-            return unique_values.issubset(bool_patterns)
-        
+        if ctx.string_like:
+            # More distinct values than boolean spellings means it can't be
+            # boolean; skip the string normalization entirely
+            if ctx.unique_count > 20:
+                return False
+            candidates = (
+                pd.Series(ctx.unique).astype(str).str.strip().str.lower()
+            )
+            return bool(candidates.isin(_BOOL_SET).all())
+
         return False
-    
-    def _is_datetime(self, series: pd.Series) -> bool:
+
+    def _is_datetime(self, ctx: _DetectCtx) -> bool:
         """Check if series contains datetime values."""
         # Check if pandas already detected it as datetime
-        if pd.api.types.is_datetime64_any_dtype(series):
+        if pd.api.types.is_datetime64_any_dtype(ctx.series):
             return True
-        
-        # Try to parse as datetime
-        if series.dtype == 'object':
-            sample_size = min(100, len(series.dropna()))
+
+        # Try to parse as datetime. Sampling from the (cached) unique
+        # values means low-cardinality columns parse each distinct value
+        # once instead of every repeat.
+        if ctx.string_like:
+            sample_size = min(100, len(ctx.unique))
             if sample_size == 0:
                 return False
-            
-            sample = series.dropna().head(sample_size)
-            datetime_count = 0
-            
-            for value in sample:
-                if self._can_parse_datetime(value):
-                    datetime_count += 1
-            
+
+            sample = pd.Series(ctx.unique[:sample_size])
+
+            # Cheap screen before the parser: datetime strings sit in a
+            # sane length band and contain at least one digit. Values that
+            # fail can never parse, so skip pd.to_datetime for them (and
+            # for the whole column when too few survive the screen).
+            as_str = sample.astype(str)
+            lengths = as_str.str.len()
+            plausible = (
+                (lengths >= 6) & (lengths <= 40) & as_str.str.contains(r'\d')
+            )
+            if int(plausible.sum()) / sample_size <= 0.8:
+                return False
+
+            # Parse the surviving values in one call; format='mixed' keeps
+            # the per-value parsing semantics while staying inside pandas
+            parsed = pd.to_datetime(sample[plausible], errors='coerce', format='mixed')
+
             # If more than 80% of sample can be parsed as datetime
-            return datetime_count / sample_size > 0.8
-        
+            return int(parsed.notna().sum()) / sample_size > 0.8
+
         return False
-    
-    def _can_parse_datetime(self, value: Any) -> bool:
-        """Check if a value can be parsed as datetime."""
-        if pd.isna(value):
-            return False
-        
-        try:
-            pd.to_datetime(value, errors='raise')
-            return True
-        except (ValueError, TypeError):
-            return False
-    
-    def _is_integer(self, series: pd.Series) -> bool:
+
+    def _is_integer(self, ctx: _DetectCtx) -> bool:
         """Check if series contains integer values."""
         # Check if pandas already detected it as integer
-        if pd.api.types.is_integer_dtype(series):
+        if pd.api.types.is_integer_dtype(ctx.series):
             return True
-        
-        # Try to convert to numeric and check if all values are integers
+
+        # All parseable values must be integral
         try:
-            numeric_series = pd.to_numeric(series, errors='coerce')
-            non_null = numeric_series.dropna()
-            
-            if len(non_null) == 0:
-                return False
-            
-            # Check if all values are integers
-            return all(float(val).is_integer() for val in non_null)
+            return ctx.all_integral is True
         except (ValueError, TypeError):
             return False
-    
-    def _is_float(self, series: pd.Series) -> bool:
+
+    def _is_float(self, ctx: _DetectCtx) -> bool:
         """Check if series contains float values."""
         # Check if pandas already detected it as float
-        if pd.api.types.is_float_dtype(series):
+        if pd.api.types.is_float_dtype(ctx.series):
             return True
-        
-        # Try to convert to numeric
+
+        # Parseable as numeric with at least one fractional value
         try:
-            numeric_series = pd.to_numeric(series, errors='coerce')
-            non_null = numeric_series.dropna()
-            
-            if len(non_null) == 0:
-                return False
-            
-            # If we can convert to numeric and not all are integers, it's float
-            return not all(float(val).is_integer() for val in non_null)
+            return ctx.all_integral is False
         except (ValueError, TypeError):
             return False
-    
-    def _is_categorical(self, series: pd.Series) -> bool:
+
+    def _is_categorical(self, ctx: _DetectCtx) -> bool:
         """Check if series should be treated as categorical."""
-        non_null = series.dropna()
-        
-        if len(non_null) == 0:
-            return False
-        
         # Calculate ratio of unique values to total values
-        unique_ratio = len(non_null.unique()) / len(non_null)
-        
+        unique_ratio = ctx.unique_count / ctx.n
+
         # If ratio is below threshold, consider it categorical
         if unique_ratio <= self.categorical_threshold:
             return True
-        
+
         # Also check if it's a string field with limited unique values
-        if series.dtype == 'object' and unique_ratio <= 0.3:
+        if ctx.string_like and unique_ratio <= 0.3:
             return True
-        
+
         return False
 
 
@@ -271,16 +442,40 @@ def get_sample_values(series: pd.Series, max_samples: int = 5) -> List[Any]:
         List of sample values
     """
     non_null = series.dropna()
-    
+
     if len(non_null) == 0:
         return []
-    
+
     # Get unique values first
     unique_values = non_null.unique()
-    
+
     # If we have fewer unique values than max_samples, return all
     if len(unique_values) <= max_samples:
-        return unique_values.tolist()
-    
-    # Otherwise, sample from unique values
-    return np.random.choice(unique_values, size=max_samples, replace=False).tolist() 
\ No newline at end of file
+        return _to_python_values(unique_values.tolist())
+
+    # Otherwise, sample max_samples distinct indices in O(max_samples)
+    # instead of letting np.random.choice permute the whole unique array
+    indices = random.sample(range(len(unique_values)), max_samples)
+    return _to_python_values([unique_values[i] for i in indices])
+
+
+def _to_python_values(values: List[Any]) -> List[Any]:
+    """
+    Convert sampled values to JSON-friendly Python values.
+
+    Datetime-like values are rendered as ISO strings and numpy scalars
+    unboxed to Python ones so analysis results round-trip cleanly
+    through JSON.
+
+    Args:
+        values: List of raw sample values
+
+    Returns:
+        List of JSON-friendly values
+    """
+    return [
+        val.isoformat() if isinstance(val, (pd.Timestamp, datetime))
+        else val.item() if isinstance(val, np.generic)
+        else val
+        for val in values
+    ] 
\ No newline at end of file
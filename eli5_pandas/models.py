@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FieldType(str, Enum):
@@ -22,15 +22,24 @@ class FieldType(str, Enum):
 
 class CategoricalStats(BaseModel):
     """Statistics for categorical fields."""
+
+    model_config = ConfigDict(frozen=True)
     
     unique_count: int = Field(..., description="Number of unique values")
-    top_values: List[Dict[str, Any]] = Field(..., description="Top 10 most frequent values with counts")
+    # Top values are stored structure-of-arrays style: three parallel
+    # lists instead of one dict per entry, which serializes smaller and
+    # iterates without per-entry hash lookups
+    top_values: List[str] = Field(..., description="Top 10 most frequent values")
+    top_counts: List[int] = Field(..., description="Count for each top value")
+    top_percentages: List[float] = Field(..., description="Percentage share for each top value")
     missing_count: int = Field(..., description="Number of missing values")
     missing_percentage: float = Field(..., description="Percentage of missing values")
 
 
 class NumericalStats(BaseModel):
     """Statistics for numerical fields."""
+
+    model_config = ConfigDict(frozen=True)
     
     min_value: Optional[Union[int, float]] = Field(None, description="Minimum value")
     max_value: Optional[Union[int, float]] = Field(None, description="Maximum value")
@@ -44,6 +53,8 @@ class NumericalStats(BaseModel):
 
 class StringStats(BaseModel):
     """Statistics for string fields."""
+
+    model_config = ConfigDict(frozen=True)
     
     min_length: Optional[int] = Field(None, description="Minimum string length")
     max_length: Optional[int] = Field(None, description="Maximum string length")
@@ -55,6 +66,8 @@ class StringStats(BaseModel):
 
 class DateTimeStats(BaseModel):
     """Statistics for datetime fields."""
+
+    model_config = ConfigDict(frozen=True)
     
     min_date: Optional[datetime] = Field(None, description="Earliest date")
     max_date: Optional[datetime] = Field(None, description="Latest date")
@@ -63,26 +76,57 @@ class DateTimeStats(BaseModel):
     missing_percentage: float = Field(..., description="Percentage of missing values")
 
 
+# The statistics variants a field can carry; which one applies follows
+# from the detected field_type
+FieldStats = Union[CategoricalStats, NumericalStats, StringStats, DateTimeStats]
+
+
 class FieldAnalysis(BaseModel):
     """Analysis results for a single field."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Field name")
     field_type: FieldType = Field(..., description="Detected field type")
     total_count: int = Field(..., description="Total number of values")
-    categorical_stats: Optional[CategoricalStats] = Field(None, description="Categorical statistics")
-    numerical_stats: Optional[NumericalStats] = Field(None, description="Numerical statistics")
-    string_stats: Optional[StringStats] = Field(None, description="String statistics")
-    datetime_stats: Optional[DateTimeStats] = Field(None, description="Datetime statistics")
+    stats: Optional[FieldStats] = Field(None, description="Type-specific statistics")
     sample_values: List[Any] = Field(..., description="Sample of actual values")
 
+    # A single stats field keeps Pydantic from validating four Optional
+    # submodels per column; these accessors preserve the old per-type
+    # attribute names used by the reporter and templates.
+
+    @property
+    def categorical_stats(self) -> Optional[CategoricalStats]:
+        """Categorical statistics, if this field carries them."""
+        return self.stats if isinstance(self.stats, CategoricalStats) else None
+
+    @property
+    def numerical_stats(self) -> Optional[NumericalStats]:
+        """Numerical statistics, if this field carries them."""
+        return self.stats if isinstance(self.stats, NumericalStats) else None
+
+    @property
+    def string_stats(self) -> Optional[StringStats]:
+        """String statistics, if this field carries them."""
+        return self.stats if isinstance(self.stats, StringStats) else None
+
+    @property
+    def datetime_stats(self) -> Optional[DateTimeStats]:
+        """Datetime statistics, if this field carries them."""
+        return self.stats if isinstance(self.stats, DateTimeStats) else None
+
 
 class AnalysisResult(BaseModel):
     """Complete analysis results for a dataset."""
+
+    model_config = ConfigDict(frozen=True)
     
     file_path: str = Field(..., description="Path to the analyzed file")
     file_type: str = Field(..., description="Type of file (CSV, JSON, etc.)")
     total_rows: int = Field(..., description="Total number of rows")
     total_columns: int = Field(..., description="Total number of columns")
+    total_missing: int = Field(0, description="Total number of missing values across all fields")
     fields: List[FieldAnalysis] = Field(..., description="Analysis results for each field")
     analysis_timestamp: datetime = Field(default_factory=datetime.now, description="When analysis was performed")
     processing_time_seconds: float = Field(..., description="Time taken to perform analysis") 
\ No newline at end of file
@@ -1,33 +1,85 @@
 """HTML report generator for analysis results."""
 
 import json
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from jinja2 import Environment, FileSystemLoader, Template
 
+try:
+    # orjson parses several times faster than stdlib json; optional
+    # dependency (the 'fast' extra)
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .models import AnalysisResult, FieldAnalysis, FieldType
 
 
-def _format_number(value):
-    try:
-        return f"{int(value):,}"
-    except Exception:
-        return value
+# Enum .value lookups go through the descriptor protocol; these tables
+# are built once at import for the per-field loops below
+_FIELD_TYPE_VALUES = [ft.value for ft in FieldType]
+_FT_VAL = {ft: ft.value for ft in FieldType}
+
+
+def _format_number(value: Any) -> Any:
+    # isinstance checks instead of try/int/except: non-numeric values hit
+    # no exception machinery, and the common int case is a straight format
+    if isinstance(value, (int, np.integer)):
+        return format(int(value), ',d')
+    if isinstance(value, (float, np.floating)):
+        return format(int(value), ',d') if np.isfinite(value) else value
+    return value
+
+
+def _missing_class(missing_percentage: float) -> str:
+    """CSS class for a missing-data percentage (red/amber/green)."""
+    if missing_percentage > 10:
+        return 'missing-data'
+    if missing_percentage > 5:
+        return 'warning-data'
+    return 'good-data'
+
+
+def _get_template_dir() -> str:
+    """Get the directory containing HTML templates."""
+    return str(Path(__file__).parent / "templates")
+
+
+# One environment shared by every HTMLReporter instance so templates are
+# parsed and compiled once per process, not once per reporter
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(_get_template_dir()),
+    auto_reload=False,
+    cache_size=-1,
+)
+_TEMPLATE_ENV.filters['format_number'] = _format_number
+
+
+@lru_cache(maxsize=None)
+def _get_report_template() -> Template:
+    """Return the compiled report template, loading it on first use."""
+    return _TEMPLATE_ENV.get_template("report.html")
 
 
 class HTMLReporter:
     """Generates professional HTML reports from analysis results."""
-    
+
+    # Set once the default template has been materialized on disk, so
+    # importing this module never touches the filesystem and repeat
+    # instantiations skip the exists/mkdir syscalls
+    _template_ready = False
+
     def __init__(self) -> None:
         """Initialize the HTML reporter."""
-        self.env = Environment(loader=FileSystemLoader(self._get_template_dir()))
-        self.env.filters['format_number'] = _format_number
-    
-    def _get_template_dir(self) -> str:
-        """Get the directory containing HTML templates."""
-        return str(Path(__file__).parent / "templates")
-    
+        if not HTMLReporter._template_ready:
+            create_default_template()
+            HTMLReporter._template_ready = True
+        self.env = _TEMPLATE_ENV
+
     def generate_report(self, analysis_result: AnalysisResult, output_path: str, charts: Optional[Dict[str, str]] = None, sample_df: Optional[Any] = None, show_all_stats: bool = False) -> None:
         """
         Generate an HTML report from analysis results.
@@ -35,21 +87,24 @@ class HTMLReporter:
         Args:
             analysis_result: AnalysisResult object
             output_path: Path where to save the HTML file
-            charts: Optional dictionary of charts to include
+            charts: Optional dictionary of charts to include. Each value
+                must be a bare chart div (no embedded plotly.js, i.e.
+                the ``include_plotlyjs=False`` form); the template loads
+                plotly.js once from a pinned CDN URL, so embedding the
+                library per chart would duplicate megabytes per figure
             sample_df: Optional sample DataFrame to display
             show_all_stats: Whether to show all available statistics in the HTML report
         """
-        template = self.env.get_template("report.html")
+        template = _get_report_template()
         
         # Prepare template context
         context = self._prepare_context(analysis_result, charts, sample_df, show_all_stats)
-        
-        # Render the template
-        html_content = template.render(**context)
-        
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+
+        # Stream the render straight to disk through a wide buffer, so
+        # peak memory stays at the buffer size instead of the whole
+        # rendered document
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            template.stream(**context).dump(f)
     
     def _prepare_context(self, analysis_result: AnalysisResult, charts: Optional[Dict[str, str]] = None, sample_df: Optional[Any] = None, show_all_stats: bool = False) -> Dict[str, Any]:
         """
@@ -64,30 +119,145 @@ class HTMLReporter:
         Returns:
             Dictionary with template context
         """
-        # Group fields by type
-        fields_by_type = self._group_fields_by_type(analysis_result.fields)
-        
+        # Group fields by type, then flatten each field into a row of
+        # already-formatted strings: stats are formatted and CSS-classed
+        # here in one Python pass, so the template loop just emits them
+        # instead of probing four stats attributes and dispatching
+        # filters per field
+        chart_map = charts or {}
+        fields_by_type = {
+            field_type: [
+                self._build_field_row(field, chart_map, show_all_stats)
+                for field in type_fields
+            ]
+            for field_type, type_fields in
+            self._group_fields_by_type(analysis_result.fields).items()
+        }
+
         # Calculate summary statistics
         summary_stats = self._calculate_summary_stats(analysis_result)
         
-        # Convert sample_df to records for Jinja2
+        # Convert sample_df to plain row tuples for Jinja2. itertuples
+        # skips the per-cell scalar boxing that to_dict(orient='records')
+        # does, and the template iterates cells positionally so no
+        # per-row dict is ever built.
         sample_table = None
         sample_columns = None
         if sample_df is not None:
-            sample_table = sample_df.to_dict(orient='records')
             sample_columns = list(sample_df.columns)
+            sample_table = list(sample_df.itertuples(index=False, name=None))
         
         return {
             "analysis": analysis_result,
             "fields_by_type": fields_by_type,
             "summary_stats": summary_stats,
-            "field_types": [ft.value for ft in FieldType],
+            "field_types": _FIELD_TYPE_VALUES,
             "charts": charts or {},
             "sample_table": sample_table,
             "sample_columns": sample_columns,
             "show_all_stats": show_all_stats,
         }
     
+    def _build_field_row(
+        self,
+        field: FieldAnalysis,
+        charts: Dict[str, str],
+        show_all_stats: bool
+    ) -> Dict[str, Any]:
+        """
+        Flatten a FieldAnalysis into a template-ready row.
+
+        Args:
+            field: FieldAnalysis object
+            charts: Dictionary of chart HTML snippets
+            show_all_stats: Whether to include the extended numerical stats
+
+        Returns:
+            Dictionary with preformatted name, badge, stats tuples,
+            sample values, and chart HTML
+        """
+        stats = [("Total Values", _format_number(field.total_count), '')]
+        stats.extend(self._field_stat_rows(field, show_all_stats))
+
+        return {
+            "name": field.name,
+            "type": _FT_VAL[field.field_type],
+            "stats": stats,
+            "sample_values": (
+                ", ".join(str(val) for val in field.sample_values)
+                if field.sample_values else None
+            ),
+            "chart": charts.get('field_' + field.name),
+        }
+
+    def _field_stat_rows(
+        self,
+        field: FieldAnalysis,
+        show_all_stats: bool
+    ) -> List[Any]:
+        """
+        Build (label, value, css_class) tuples for a field's statistics.
+
+        Args:
+            field: FieldAnalysis object
+            show_all_stats: Whether to include the extended numerical stats
+
+        Returns:
+            List of (label, formatted value, css class) tuples
+        """
+        def missing_row(missing_percentage: float) -> Any:
+            return (
+                "Missing Data",
+                f"{missing_percentage}%",
+                _missing_class(missing_percentage),
+            )
+
+        rows: List[Any] = []
+
+        # The per-type accessors narrow the stats union for mypy
+        if (categorical := field.categorical_stats) is not None:
+            rows.append(("Unique Values", _format_number(categorical.unique_count), ''))
+            rows.append(missing_row(categorical.missing_percentage))
+        elif (numerical := field.numerical_stats) is not None:
+            if show_all_stats:
+                rows.append(("Min", numerical.min_value, ''))
+                rows.append(("Max", numerical.max_value, ''))
+                for label, value in (
+                    ("Mean", numerical.mean),
+                    ("Median", numerical.median),
+                    ("Std Dev", numerical.std_dev),
+                ):
+                    rows.append((label, round(value, 2) if value is not None else 'N/A', ''))
+                quartiles = numerical.quartiles or {}
+                for label, key in (("Q1 (25%)", 'q25'), ("Q2 (50%)", 'q50'), ("Q3 (75%)", 'q75')):
+                    if quartiles.get(key) is not None:
+                        rows.append((label, round(quartiles[key], 2), ''))
+            else:
+                for label, value in (("Mean", numerical.mean), ("Std Dev", numerical.std_dev)):
+                    rows.append((label, round(value, 2) if value else 'N/A', ''))
+            rows.append(missing_row(numerical.missing_percentage))
+        elif (string := field.string_stats) is not None:
+            rows.append((
+                "Avg Length",
+                round(string.avg_length, 1) if string.avg_length else 'N/A',
+                ''
+            ))
+            rows.append(("Unique Values", _format_number(string.unique_count), ''))
+            rows.append(missing_row(string.missing_percentage))
+        elif (dt := field.datetime_stats) is not None:
+            for label, date in (
+                ("Earliest Date", dt.min_date),
+                ("Latest Date", dt.max_date),
+            ):
+                rows.append((
+                    label,
+                    date.strftime('%Y-%m-%d') if date else 'N/A',
+                    ''
+                ))
+            rows.append(missing_row(dt.missing_percentage))
+
+        return rows
+
     def _group_fields_by_type(self, fields: List[FieldAnalysis]) -> Dict[str, List[FieldAnalysis]]:
         """
         Group fields by their detected type.
@@ -98,14 +268,11 @@ class HTMLReporter:
         Returns:
             Dictionary mapping field types to lists of fields
         """
-        grouped = {}
+        grouped: Dict[str, List[FieldAnalysis]] = defaultdict(list)
         for field in fields:
-            field_type = field.field_type.value
-            if field_type not in grouped:
-                grouped[field_type] = []
-            grouped[field_type].append(field)
-        
-        return grouped
+            grouped[_FT_VAL[field.field_type]].append(field)
+
+        return dict(grouped)
     
     def _calculate_summary_stats(self, analysis_result: AnalysisResult) -> Dict[str, Any]:
         """
@@ -118,28 +285,30 @@ class HTMLReporter:
             Dictionary with summary statistics
         """
         total_fields = len(analysis_result.fields)
-        total_missing = sum(
-            field.categorical_stats.missing_count if field.categorical_stats else 0
-            or field.numerical_stats.missing_count if field.numerical_stats else 0
-            or field.string_stats.missing_count if field.string_stats else 0
-            or field.datetime_stats.missing_count if field.datetime_stats else 0
+
+        # The analyzer records the vectorized total; fall back to summing
+        # whatever per-field stats are present when it's absent. Results
+        # loaded from pre-stats-union JSON carry no stats at all, so the
+        # fallback reports zero missing for them rather than failing
+        total_missing = analysis_result.total_missing or sum(
+            field.stats.missing_count if field.stats is not None else 0
             for field in analysis_result.fields
         )
-        
+
         # Count fields by type
-        type_counts = {}
-        for field in analysis_result.fields:
-            field_type = field.field_type.value
-            type_counts[field_type] = type_counts.get(field_type, 0) + 1
-        
+        type_counts = dict(Counter(
+            _FT_VAL[field.field_type] for field in analysis_result.fields
+        ))
+
+        total_cells = analysis_result.total_rows * total_fields
+
         return {
             "total_fields": total_fields,
             "total_missing": total_missing,
             "type_counts": type_counts,
             "completeness_percentage": round(
-                ((analysis_result.total_rows * total_fields) - total_missing) / 
-                (analysis_result.total_rows * total_fields) * 100, 2
-            ) if total_fields > 0 else 0
+                (total_cells - total_missing) / total_cells * 100, 2
+            ) if total_cells > 0 else 0
         }
     
     def generate_from_json(self, json_path: str, output_path: str) -> None:
@@ -151,9 +320,9 @@ class HTMLReporter:
             output_path: Path where to save the HTML file
         """
         # Load analysis result from JSON
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        
+        raw = Path(json_path).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
         analysis_result = AnalysisResult.model_validate(data)
         self.generate_report(analysis_result, output_path)
 
@@ -173,7 +342,7 @@ def create_default_template() -> None:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Data Analysis Report - {{ analysis.file_path }}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
     <style>
         * {
             margin: 0;
@@ -460,89 +629,27 @@ def create_default_template() -> None:
                 <div class="field-card">
                     <div class="field-header">
                         <div class="field-name">{{ field.name }}</div>
-                        <div class="field-type-badge">{{ field.field_type.value }}</div>
+                        <div class="field-type-badge">{{ field.type }}</div>
                     </div>
                     
                     <div class="stats-grid">
+                        {% for label, value, css in field.stats %}
                         <div class="stat-item">
-                            <div class="stat-value">{{ field.total_count | format_number }}</div>
-                            <div class="stat-label">Total Values</div>
-                        </div>
-                        
-                        {% if field.categorical_stats %}
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.categorical_stats.unique_count | format_number }}</div>
-                            <div class="stat-label">Unique Values</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value {% if field.categorical_stats.missing_percentage > 10 %}missing-data{% elif field.categorical_stats.missing_percentage > 5 %}warning-data{% else %}good-data{% endif %}">
-                                {{ field.categorical_stats.missing_percentage }}%
-                            </div>
-                            <div class="stat-label">Missing Data</div>
-                        </div>
-                        {% endif %}
-                        
-                        {% if field.numerical_stats %}
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.numerical_stats.mean | round(2) if field.numerical_stats.mean else 'N/A' }}</div>
-                            <div class="stat-label">Mean</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.numerical_stats.std_dev | round(2) if field.numerical_stats.std_dev else 'N/A' }}</div>
-                            <div class="stat-label">Std Dev</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value {% if field.numerical_stats.missing_percentage > 10 %}missing-data{% elif field.numerical_stats.missing_percentage > 5 %}warning-data{% else %}good-data{% endif %}">
-                                {{ field.numerical_stats.missing_percentage }}%
-                            </div>
-                            <div class="stat-label">Missing Data</div>
+                            <div class="stat-value{% if css %} {{ css }}{% endif %}">{{ value }}</div>
+                            <div class="stat-label">{{ label }}</div>
                         </div>
-                        {% endif %}
-                        
-                        {% if field.string_stats %}
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.string_stats.avg_length | round(1) if field.string_stats.avg_length else 'N/A' }}</div>
-                            <div class="stat-label">Avg Length</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.string_stats.unique_count | format_number }}</div>
-                            <div class="stat-label">Unique Values</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value {% if field.string_stats.missing_percentage > 10 %}missing-data{% elif field.string_stats.missing_percentage > 5 %}warning-data{% else %}good-data{% endif %}">
-                                {{ field.string_stats.missing_percentage }}%
-                            </div>
-                            <div class="stat-label">Missing Data</div>
-                        </div>
-                        {% endif %}
-                        
-                        {% if field.datetime_stats %}
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.datetime_stats.min_date.strftime('%Y-%m-%d') if field.datetime_stats.min_date else 'N/A' }}</div>
-                            <div class="stat-label">Earliest Date</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value">{{ field.datetime_stats.max_date.strftime('%Y-%m-%d') if field.datetime_stats.max_date else 'N/A' }}</div>
-                            <div class="stat-label">Latest Date</div>
-                        </div>
-                        <div class="stat-item">
-                            <div class="stat-value {% if field.datetime_stats.missing_percentage > 10 %}missing-data{% elif field.datetime_stats.missing_percentage > 5 %}warning-data{% else %}good-data{% endif %}">
-                                {{ field.datetime_stats.missing_percentage }}%
-                            </div>
-                            <div class="stat-label">Missing Data</div>
-                        </div>
-                        {% endif %}
+                        {% endfor %}
                     </div>
                     
                     {% if field.sample_values %}
                     <div class="sample-values">
-                        <strong>Sample Values:</strong> {{ field.sample_values | join(', ') }}
+                        <strong>Sample Values:</strong> {{ field.sample_values }}
                     </div>
                     {% endif %}
                     
-                    {% if charts['field_' + field.name] %}
+                    {% if field.chart %}
                     <div class="field-chart">
-                        {{ charts['field_' + field.name] | safe }}
+                        {{ field.chart | safe }}
                     </div>
                     {% endif %}
                 </div>
@@ -554,9 +661,4 @@ def create_default_template() -> None:
 </body>
 </html>"""
         
-        with open(template_path, 'w', encoding='utf-8') as f:
-            f.write(template_content)
-
-
-# Create the default template when the module is imported
-create_default_template() 
\ No newline at end of file
+        template_path.write_text(template_content, encoding='utf-8') 
\ No newline at end of file
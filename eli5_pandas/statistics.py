@@ -1,7 +1,7 @@
 """Statistics calculation for different field types."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -9,62 +9,160 @@ import pandas as pd
 from .models import CategoricalStats, DateTimeStats, NumericalStats, StringStats
 
 
+def _numerical_reductions(values: np.ndarray) -> Tuple[float, float, float, float, float, float, float, float]:
+    """
+    One-pass numerical reductions over a non-empty float64 array.
+
+    Returns min, max, mean, median, sample std dev, and the 25th/50th/75th
+    percentiles. Written against the NumPy subset Numba supports so it can
+    be JIT-compiled when numba is installed (the 'fast' extra).
+    """
+    count = values.size
+    min_value = values.min()
+    max_value = values.max()
+    mean = values.mean()
+    if count > 1:
+        std_dev = np.sqrt(((values - mean) ** 2).sum() / (count - 1))
+    else:
+        std_dev = np.nan
+    q25, q50, q75 = np.quantile(values, np.array([0.25, 0.50, 0.75]))
+    return min_value, max_value, mean, q50, std_dev, q25, q50, q75
+
+
+try:
+    from numba import njit
+
+    _numerical_reductions = njit(cache=True, fastmath=True)(_numerical_reductions)
+    # Warm the JIT once at import so the first analyzed column doesn't
+    # pay the compile cost
+    _numerical_reductions(np.array([0.0]))
+except ImportError:
+    pass
+
+
 class StatisticsCalculator:
     """Calculates statistics for different field types."""
     
     def __init__(self) -> None:
         """Initialize the statistics calculator."""
-        pass
+        # O(1) dispatch table for calculate_field_statistics; booleans
+        # are treated as categorical for statistics
+        self._dispatch: Dict[
+            str,
+            Callable[..., Union[CategoricalStats, NumericalStats, StringStats, DateTimeStats]],
+        ] = {
+            "categorical": self.calculate_categorical_stats,
+            "boolean": self.calculate_categorical_stats,
+            "integer": self.calculate_numerical_stats,
+            "float": self.calculate_numerical_stats,
+            "string": self.calculate_string_stats,
+            "datetime": self.calculate_datetime_stats,
+        }
     
-    def calculate_categorical_stats(self, series: pd.Series) -> CategoricalStats:
+    def _missing(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None
+    ) -> Tuple[int, int, float]:
+        """
+        Shared missing-data prelude for the calculate_* methods.
+
+        Args:
+            series: Series being analyzed
+            missing_count: Precomputed number of missing values, if already known
+
+        Returns:
+            (total_count, missing_count, missing_percentage) tuple
+        """
+        total_count = len(series)
+        if missing_count is None:
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind == 'f':
+                # Single C pass over the raw float buffer instead of
+                # building an intermediate boolean series
+                missing_count = int(np.count_nonzero(np.isnan(series.to_numpy())))
+            else:
+                missing_count = int(series.isna().sum())
+        missing_percentage = (missing_count / total_count) * 100 if total_count > 0 else 0.0
+        return total_count, missing_count, round(missing_percentage, 2)
+
+    def calculate_categorical_stats(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None,
+        value_counts: Optional[pd.Series] = None
+    ) -> CategoricalStats:
         """
         Calculate statistics for categorical fields.
         
         Args:
             series: Pandas Series containing categorical data
-            
+            missing_count: Precomputed number of missing values, if already known
+            value_counts: Precomputed value counts for the series, if already known
+
         Returns:
             CategoricalStats object
         """
-        total_count = len(series)
-        missing_count = series.isna().sum()
-        missing_percentage = (missing_count / total_count) * 100 if total_count > 0 else 0
-        
-        # Get value counts for top values
-        value_counts = series.value_counts().head(10)
-        top_values = [
-            {"value": str(val), "count": int(count), "percentage": (count / total_count) * 100}
-            for val, count in value_counts.items()
-        ]
-        
-        unique_count = len(series.unique())
-        
+        # One hash pass over the column: counting with dropna=False makes
+        # the NaN bucket supply the missing count, while the remaining
+        # buckets supply the unique count and the top values
+        if value_counts is None:
+            value_counts = series.value_counts(dropna=False)
+            na_mask = value_counts.index.isna()
+            if na_mask.any():
+                if missing_count is None:
+                    missing_count = int(value_counts[na_mask].sum())
+                value_counts = value_counts[~na_mask]
+            elif missing_count is None:
+                missing_count = 0
+        total_count, missing_count, missing_percentage = self._missing(series, missing_count)
+
+        unique_count = len(value_counts)
+
+        # Top values stored as parallel lists; astype(str) converts the
+        # index labels in one vectorized pass rather than one str() call
+        # per label
+        top = value_counts.head(10)
+        top_values = top.index.astype(str).tolist()
+        top_counts = [int(count) for count in top.to_numpy()]
+        pct_factor = 100.0 / total_count if total_count > 0 else 0.0
+        top_percentages = [count * pct_factor for count in top_counts]
+
         return CategoricalStats(
             unique_count=unique_count,
             top_values=top_values,
+            top_counts=top_counts,
+            top_percentages=top_percentages,
             missing_count=int(missing_count),
-            missing_percentage=round(missing_percentage, 2)
+            missing_percentage=missing_percentage
         )
-    
-    def calculate_numerical_stats(self, series: pd.Series) -> NumericalStats:
+
+    def calculate_numerical_stats(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None
+    ) -> NumericalStats:
         """
         Calculate statistics for numerical fields.
         
         Args:
             series: Pandas Series containing numerical data
+            missing_count: Precomputed number of missing values, if already known
             
         Returns:
             NumericalStats object
         """
-        total_count = len(series)
-        missing_count = series.isna().sum()
-        missing_percentage = (missing_count / total_count) * 100 if total_count > 0 else 0
+        total_count, missing_count, missing_percentage = self._missing(series, missing_count)
         
-        # Convert to numeric, coercing errors to NaN
-        numeric_series = pd.to_numeric(series, errors='coerce')
-        non_null_series = numeric_series.dropna()
-        
-        if len(non_null_series) == 0:
+        # Reduce over a plain float64 array; already-numeric dtypes skip
+        # the pd.to_numeric coercion pass entirely
+        if series.dtype.kind in 'iuf':
+            numeric_series = series
+        else:
+            numeric_series = pd.to_numeric(series, errors='coerce')
+        values = numeric_series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+
+        if values.size == 0:
             return NumericalStats(
                 min_value=None,
                 max_value=None,
@@ -73,23 +171,15 @@ class StatisticsCalculator:
                 std_dev=None,
                 quartiles=None,
                 missing_count=int(missing_count),
-                missing_percentage=round(missing_percentage, 2)
+                missing_percentage=missing_percentage
             )
         
-        # Calculate basic statistics
-        min_value = float(non_null_series.min())
-        max_value = float(non_null_series.max())
-        mean = float(non_null_series.mean())
-        median = float(non_null_series.median())
-        std_dev = float(non_null_series.std())
-        
-        # Calculate quartiles
-        quartiles = {
-            "q25": float(non_null_series.quantile(0.25)),
-            "q50": float(non_null_series.quantile(0.50)),
-            "q75": float(non_null_series.quantile(0.75))
-        }
-        
+        # Calculate basic statistics and quartiles in one fused pass
+        min_value, max_value, mean, median, std_dev, q25, q50, q75 = (
+            float(stat) for stat in _numerical_reductions(values)
+        )
+        quartiles = {"q25": q25, "q50": q50, "q75": q75}
+
         return NumericalStats(
             min_value=min_value,
             max_value=max_value,
@@ -98,27 +188,31 @@ class StatisticsCalculator:
             std_dev=round(std_dev, 4),
             quartiles=quartiles,
             missing_count=int(missing_count),
-            missing_percentage=round(missing_percentage, 2)
+            missing_percentage=missing_percentage
         )
     
-    def calculate_string_stats(self, series: pd.Series) -> StringStats:
+    def calculate_string_stats(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None
+    ) -> StringStats:
         """
         Calculate statistics for string fields.
         
         Args:
             series: Pandas Series containing string data
+            missing_count: Precomputed number of missing values, if already known
             
         Returns:
             StringStats object
         """
-        total_count = len(series)
-        missing_count = series.isna().sum()
-        missing_percentage = (missing_count / total_count) * 100 if total_count > 0 else 0
-        
-        # Convert to string and calculate lengths
-        string_series = series.astype(str)
-        non_null_series = string_series[string_series != 'nan']
+        total_count, missing_count, missing_percentage = self._missing(series, missing_count)
         
+        # Drop nulls directly instead of the old astype(str) + != 'nan'
+        # sentinel filter, which both copied the column and ate any
+        # legitimate "nan" strings
+        non_null_series = series.dropna()
+
         if len(non_null_series) == 0:
             return StringStats(
                 min_length=None,
@@ -126,16 +220,30 @@ class StatisticsCalculator:
                 avg_length=None,
                 unique_count=0,
                 missing_count=int(missing_count),
-                missing_percentage=round(missing_percentage, 2)
+                missing_percentage=missing_percentage
             )
-        
-        # Calculate string lengths
-        lengths = non_null_series.str.len()
-        min_length = int(lengths.min())
-        max_length = int(lengths.max())
-        avg_length = float(lengths.mean())
-        
-        unique_count = len(non_null_series.unique())
+
+        # Arrow-backed strings compute lengths in C without building a
+        # Python string per cell; mixed object columns fall back to str
+        if non_null_series.dtype == object:
+            try:
+                non_null_series = non_null_series.astype('string[pyarrow]')
+            except (TypeError, ValueError):
+                non_null_series = non_null_series.astype(str)
+
+        # One lengths pass feeds all three reductions. Dtypes the .str
+        # accessor rejects (e.g. Arrow dictionary columns) cast first.
+        try:
+            lengths_series = non_null_series.str.len()
+        except AttributeError:
+            non_null_series = non_null_series.astype('string[pyarrow]')
+            lengths_series = non_null_series.str.len()
+        lengths = lengths_series.to_numpy(dtype='float64', na_value=np.nan)
+        min_length = int(np.nanmin(lengths))
+        max_length = int(np.nanmax(lengths))
+        avg_length = float(np.nanmean(lengths))
+
+        unique_count = int(non_null_series.nunique())
         
         return StringStats(
             min_length=min_length,
@@ -143,50 +251,79 @@ class StatisticsCalculator:
             avg_length=round(avg_length, 2),
             unique_count=unique_count,
             missing_count=int(missing_count),
-            missing_percentage=round(missing_percentage, 2)
+            missing_percentage=missing_percentage
         )
     
-    def calculate_datetime_stats(self, series: pd.Series) -> DateTimeStats:
+    def calculate_datetime_stats(
+        self,
+        series: pd.Series,
+        missing_count: Optional[int] = None
+    ) -> DateTimeStats:
         """
         Calculate statistics for datetime fields.
         
         Args:
             series: Pandas Series containing datetime data
+            missing_count: Precomputed number of missing values, if already known
             
         Returns:
             DateTimeStats object
         """
-        total_count = len(series)
-        missing_count = series.isna().sum()
-        missing_percentage = (missing_count / total_count) * 100 if total_count > 0 else 0
-        
-        # Convert to datetime if not already
+        total_count, missing_count, missing_percentage = self._missing(series, missing_count)
+
+        # NumPy-backed datetime64 columns skip the pd.to_datetime copy and
+        # reduce over the raw int64 ticks, which is about twice as fast as
+        # reducing over datetime64 values
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == 'M':
+            arr = series.to_numpy()
+            ticks = arr.view('i8')[~np.isnat(arr)]
+            if ticks.size == 0:
+                return DateTimeStats(
+                    min_date=None,
+                    max_date=None,
+                    unique_count=0,
+                    missing_count=int(missing_count),
+                    missing_percentage=missing_percentage
+                )
+            unit = np.datetime_data(arr.dtype)[0]
+            return DateTimeStats(
+                min_date=pd.Timestamp(int(ticks.min()), unit=unit).to_pydatetime(),
+                max_date=pd.Timestamp(int(ticks.max()), unit=unit).to_pydatetime(),
+                unique_count=len(pd.unique(ticks)),
+                missing_count=int(missing_count),
+                missing_percentage=missing_percentage
+            )
+
+        # Convert to datetime if not already (tz-aware and Arrow-backed
+        # columns included)
         if not pd.api.types.is_datetime64_any_dtype(series):
             datetime_series = pd.to_datetime(series, errors='coerce')
         else:
             datetime_series = series
-        
+
         non_null_series = datetime_series.dropna()
-        
+
         if len(non_null_series) == 0:
             return DateTimeStats(
                 min_date=None,
                 max_date=None,
                 unique_count=0,
                 missing_count=int(missing_count),
-                missing_percentage=round(missing_percentage, 2)
+                missing_percentage=missing_percentage
             )
-        
+
         min_date = non_null_series.min().to_pydatetime()
         max_date = non_null_series.max().to_pydatetime()
-        unique_count = len(non_null_series.unique())
-        
+        # nunique counts through a hash set without materializing the
+        # unique array
+        unique_count = int(non_null_series.nunique())
+
         return DateTimeStats(
             min_date=min_date,
             max_date=max_date,
             unique_count=unique_count,
             missing_count=int(missing_count),
-            missing_percentage=round(missing_percentage, 2)
+            missing_percentage=missing_percentage
         )
     
     def calculate_field_statistics(
@@ -204,16 +341,5 @@ class StatisticsCalculator:
         Returns:
             Appropriate statistics object or None
         """
-        if field_type == "categorical":
-            return self.calculate_categorical_stats(series)
-        elif field_type in ["integer", "float"]:
-            return self.calculate_numerical_stats(series)
-        elif field_type == "string":
-            return self.calculate_string_stats(series)
-        elif field_type == "datetime":
-            return self.calculate_datetime_stats(series)
-        elif field_type == "boolean":
-            # Treat boolean as categorical for statistics
-            return self.calculate_categorical_stats(series)
-        else:
-            return None 
\ No newline at end of file
+        calculator = self._dispatch.get(field_type)
+        return calculator(series) if calculator is not None else None 
\ No newline at end of file
@@ -0,0 +1,44 @@
+import pytest
+from functools import lru_cache
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (e.g. the XLSX reader path)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def reporter():
+    """One HTMLReporter for the whole session.
+
+    Template parsing is already cached at module level in
+    eli5_pandas.reporter, so this mainly spares the repeated
+    default-template check and instance setup.
+    """
+    from eli5_pandas.reporter import HTMLReporter
+    return HTMLReporter()
+
+
+@pytest.fixture(scope="session")
+def analyze_cached():
+    """Analyze a file at most once per test session, keyed on path."""
+    # Imported here rather than at module level so conftest loading (and
+    # with it every pytest invocation, including --collect-only) doesn't
+    # pay the pandas import unless an analysis test actually runs
+    from eli5_pandas.analyzer import DataAnalyzer
+
+    @lru_cache(maxsize=None)
+    def _analyze(path):
+        return DataAnalyzer().analyze_file(path)
+    return _analyze
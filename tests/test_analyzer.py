@@ -9,7 +9,7 @@ SAMPLE_DIR = Path(__file__).parent.parent / "sample_data"
 @pytest.mark.parametrize("filename", [
     "sample_data.csv",
     "sample_data.json",
-    "sample_data.xlsx",
+    pytest.param("sample_data.xlsx", marks=pytest.mark.slow),
     "sample_data.parquet",
     "sample_data_with_missing.csv",
     "sample_data_with_missing.json",
@@ -28,9 +28,29 @@ def test_analyze_file(filename):
     assert any(ft in field_types for ft in ["categorical", "string", "integer", "float"])
 
 
-def test_save_and_load_json(tmp_path):
+def test_analyze_parquet_streaming():
+    # Force the column-at-a-time path with a tiny row threshold and check
+    # it agrees with the whole-table path
+    file_path = str(SAMPLE_DIR / "sample_data.parquet")
+    streamed = DataAnalyzer(streaming_row_threshold=10).analyze_file(file_path)
+    loaded = DataAnalyzer().analyze_file(file_path)
+    assert streamed.total_rows == loaded.total_rows
+    assert streamed.total_columns == loaded.total_columns
+    assert [f.name for f in streamed.fields] == [f.name for f in loaded.fields]
+    assert [f.field_type for f in streamed.fields] == [f.field_type for f in loaded.fields]
+
+
+# Covers both the Arrow-backed (csv) and numpy-backed (json/parquet)
+# analysis paths, whose sample values box differently
+@pytest.mark.parametrize("filename", [
+    "sample_data.csv",
+    "sample_data.json",
+    "sample_data.parquet",
+    "sample_data_with_missing.json",
+])
+def test_save_and_load_json(tmp_path, filename):
     analyzer = DataAnalyzer()
-    file_path = SAMPLE_DIR / "sample_data.csv"
+    file_path = SAMPLE_DIR / filename
     result = analyzer.analyze_file(str(file_path))
     json_path = tmp_path / "analysis.json"
     analyzer.save_analysis_to_json(result, str(json_path))
@@ -8,148 +8,157 @@ from pathlib import Path
 SAMPLE_DIR = Path(__file__).parent.parent / "sample_data"
 
 
-def test_chart_generator_initialization():
-    """Test ChartGenerator initialization."""
-    generator = ChartGenerator()
-    assert generator is not None
+@pytest.fixture(scope="module")
+def generator():
+    return ChartGenerator()
+
+
+# FieldAnalysis models and sample series are immutable, so each is built
+# once per module instead of once per test
+
+@pytest.fixture(scope="module")
+def categorical_series():
+    return pd.Series(['A', 'B', 'A', 'C', 'B', 'A', 'D', 'C'])
 
 
-def test_categorical_chart_generation():
-    """Test categorical chart generation."""
-    generator = ChartGenerator()
-    
-    # Create sample categorical data
-    data = pd.Series(['A', 'B', 'A', 'C', 'B', 'A', 'D', 'C'])
-    field = FieldAnalysis(
+@pytest.fixture(scope="module")
+def categorical_field():
+    return FieldAnalysis(
         name="test_categorical",
         field_type=FieldType.CATEGORICAL,
         total_count=8,
-        categorical_stats=None,
-        numerical_stats=None,
-        string_stats=None,
-        datetime_stats=None,
+        stats=None,
         sample_values=['A', 'B', 'C']
     )
-    
-    chart_html = generator.generate_field_chart(field, data)
-    assert chart_html is not None
-    assert "plotly" in chart_html.lower()
-    assert "bar" in chart_html.lower()
 
 
-def test_numerical_chart_generation():
-    """Test numerical chart generation."""
-    generator = ChartGenerator()
-    
-    # Create sample numerical data
-    data = pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
-    field = FieldAnalysis(
+@pytest.fixture(scope="module")
+def numerical_series():
+    return pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+
+@pytest.fixture(scope="module")
+def numerical_field():
+    return FieldAnalysis(
         name="test_numerical",
         field_type=FieldType.INTEGER,
         total_count=10,
-        categorical_stats=None,
-        numerical_stats=None,
-        string_stats=None,
-        datetime_stats=None,
+        stats=None,
         sample_values=[1, 2, 3]
     )
-    
-    chart_html = generator.generate_field_chart(field, data)
-    assert chart_html is not None
-    assert "plotly" in chart_html.lower()
-    assert "histogram" in chart_html.lower()
 
 
-def test_boolean_chart_generation():
-    """Test boolean chart generation."""
-    generator = ChartGenerator()
-    
-    # Create sample boolean data
-    data = pd.Series([True, False, True, True, False])
-    field = FieldAnalysis(
+@pytest.fixture(scope="module")
+def boolean_series():
+    return pd.Series([True, False, True, True, False])
+
+
+@pytest.fixture(scope="module")
+def boolean_field():
+    return FieldAnalysis(
         name="test_boolean",
         field_type=FieldType.BOOLEAN,
         total_count=5,
-        categorical_stats=None,
-        numerical_stats=None,
-        string_stats=None,
-        datetime_stats=None,
+        stats=None,
         sample_values=[True, False]
     )
-    
-    chart_html = generator.generate_field_chart(field, data)
-    assert chart_html is not None
-    assert "plotly" in chart_html.lower()
-    assert "pie" in chart_html.lower()
 
 
-def test_summary_charts_generation():
-    """Test summary charts generation."""
-    generator = ChartGenerator()
-    
-    # Create sample data and fields
-    data = pd.DataFrame({
+@pytest.fixture(scope="module")
+def summary_df():
+    return pd.DataFrame({
         'category': ['A', 'B', 'A', 'C'],
         'number': [1, 2, 3, 4],
         'boolean': [True, False, True, False]
     })
-    
-    fields = [
+
+
+@pytest.fixture(scope="module")
+def summary_fields():
+    return [
         FieldAnalysis(
             name="category",
             field_type=FieldType.CATEGORICAL,
             total_count=4,
-            categorical_stats=None,
-            numerical_stats=None,
-            string_stats=None,
-            datetime_stats=None,
+            stats=None,
             sample_values=['A', 'B', 'C']
         ),
         FieldAnalysis(
             name="number",
             field_type=FieldType.INTEGER,
             total_count=4,
-            categorical_stats=None,
-            numerical_stats=None,
-            string_stats=None,
-            datetime_stats=None,
+            stats=None,
             sample_values=[1, 2, 3, 4]
         ),
         FieldAnalysis(
             name="boolean",
             field_type=FieldType.BOOLEAN,
             total_count=4,
-            categorical_stats=None,
-            numerical_stats=None,
-            string_stats=None,
-            datetime_stats=None,
+            stats=None,
             sample_values=[True, False]
         )
     ]
-    
-    charts = generator.generate_summary_charts(fields, data)
+
+
+def test_chart_generator_initialization(generator):
+    """Test ChartGenerator initialization."""
+    assert generator is not None
+
+
+# Numerical charts are pre-binned bar traces rather than raw histograms,
+# hence "bar" for the integer case
+@pytest.mark.parametrize("field_fixture,series_fixture,trace_kind", [
+    ("categorical_field", "categorical_series", "bar"),
+    ("numerical_field", "numerical_series", "bar"),
+    ("boolean_field", "boolean_series", "pie"),
+])
+def test_field_chart_generation(generator, request, field_fixture, series_fixture, trace_kind):
+    """Test field chart generation for each chart-producing field type."""
+    field = request.getfixturevalue(field_fixture)
+    data = request.getfixturevalue(series_fixture)
+    # Assert on the figure spec directly instead of string-scanning the
+    # rendered HTML
+    spec = generator.generate_field_spec(field, data)
+    assert spec is not None
+    assert spec["data"][0]["type"] == trace_kind
+    chart_html = generator.generate_field_chart(field, data)
+    assert chart_html is not None
+    assert "plotly" in chart_html.lower()
+
+
+def test_summary_charts_generation(generator, summary_fields, summary_df):
+    """Test summary charts generation."""
+    charts = generator.generate_summary_charts(summary_fields, summary_df)
     assert 'field_types' in charts
-    assert charts['field_types'] is not None
-    assert "plotly" in charts['field_types'].lower()
+    field_types_chart = charts['field_types']
+    assert field_types_chart is not None
+    assert "plotly" in field_types_chart.lower()
+
+
+def test_stub_chart_mode(categorical_field, categorical_series):
+    """Stub mode returns a placeholder div carrying the trace kind."""
+    stub = ChartGenerator(mode="stub")
+    html = stub.generate_field_chart(categorical_field, categorical_series)
+    assert html == '<div class="plotly-graph-div" data-kind="bar"></div>'
 
 
 def test_analyzer_with_charts():
     """Test analyzer with chart generation."""
     analyzer = DataAnalyzer()
     file_path = SAMPLE_DIR / "sample_data.csv"
-    
+
     # Perform analysis
     result = analyzer.analyze_file(str(file_path))
-    
+
     # Generate charts
     charts = analyzer.generate_charts(result)
-    
+
     # Check that charts were generated
     assert len(charts) > 0
-    
+
     # Check that we have summary charts
     assert 'field_types' in charts
-    
+
     # Check that we have field charts for some fields
     field_charts = [k for k in charts.keys() if k.startswith('field_')]
-    assert len(field_charts) > 0 
\ No newline at end of file
+    assert len(field_charts) > 0